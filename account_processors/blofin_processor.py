@@ -1,14 +1,43 @@
 import asyncio
-import datetime
+import time
+import sys
+import functools
+import operator
+import ujson
+import logging
 from blofin import BloFinClient # https://github.com/nomeida/blofin-python
+from blofin import utils as blofin_utils
 from config.credentials import load_blofin_credentials
-from core.utils.modifiers import scale_size_and_price
+from core.mixins.scaling import ScalingMixin
 from core.unified_position import UnifiedPosition
 from core.unified_ticker import UnifiedTicker
 from core.utils.execute_timed import execute_with_timeout
-
-
-class BloFin:
+from core.utils.client_oid import generate_client_oid
+from core.utils.symbol_cache import get_cached_symbol_details, cache_symbol_details, clear_symbol_cache
+from core.utils.instrument_cache import load_instrument_cache, store_instrument_cache
+from core.utils.http_pool import pooled_session, SessionRequests
+from core.utils.single_flight import single_flight
+from core.utils.symbol_batcher import SymbolBatcher
+from core.utils.ws_ticker_feed import WSTickerFeed
+
+
+logger = logging.getLogger(__name__)
+BLOFIN_PUBLIC_WS_URL = "wss://openapi.blofin.com/ws/public"  # public market data stream
+_inst_id = operator.itemgetter("instId")  # built once; pulls the symbol out of bulk ticker/position rows in C
+
+@functools.lru_cache(maxsize=1)
+def _get_blofin_client(api_key: str, api_secret: str, passphrase: str) -> BloFinClient:
+    """Build the BloFin client once and share it across the process."""
+    # The SDK calls requests.get/post directly, so route them through a pooled keep-alive session
+    blofin_utils.requests = SessionRequests(pooled_session())
+    return BloFinClient(
+        api_key=api_key,
+        api_secret=api_secret,
+        passphrase=passphrase
+    )
+
+
+class BloFin(ScalingMixin):
     def __init__(self):
         
         self.exchange_name = "BloFin"
@@ -16,11 +45,11 @@ class BloFin:
         
         self.credentials = load_blofin_credentials()
         
-        # Initialize the BloFin client
-        self.blofin_client = BloFinClient(
-            api_key=self.credentials.blofin.api_key,
-            api_secret=self.credentials.blofin.api_secret,
-            passphrase=self.credentials.blofin.api_passphrase
+        # Reuse the process-wide BloFin client
+        self.blofin_client = _get_blofin_client(
+            self.credentials.blofin.api_key,
+            self.credentials.blofin.api_secret,
+            self.credentials.blofin.api_passphrase
         )
         
         self.margin_mode_map = { # unusued as they are not needed
@@ -29,6 +58,28 @@ class BloFin:
         }
         
         self.inverse_margin_mode_map = {v: k for k, v in self.margin_mode_map.items()} # unusued as they are not needed
+        
+        # Raw SWAP instrument data keyed by instId, filled by _refresh_instruments
+        self._instruments_by_id: dict[str, dict] = {}
+
+        # Symbol details persisted between runs; loaded lazily on the first cache miss
+        self._instrument_file_details: dict | None = None
+        
+        # Per-symbol lookups made close together are served from one bulk request
+        self._ticker_batcher = SymbolBatcher(self._fetch_all_tickers, key=_inst_id)
+        self._positions_batcher = SymbolBatcher(self._fetch_all_positions, key=_inst_id)
+        
+        # Streamed tickers, with REST covering symbols the stream hasn't delivered yet
+        self._ticker_feed = WSTickerFeed(
+            BLOFIN_PUBLIC_WS_URL,
+            subscribe_message=lambda symbol: ujson.dumps({"op": "subscribe", "args": [{"channel": "tickers", "instId": symbol}]}),
+            parse_frame=self._parse_ticker_frame,
+            ping_message="ping"
+        )
+
+    async def aclose(self):
+        """Stop the ticker stream; call once at program exit."""
+        await self._ticker_feed.close()
 
     async def fetch_balance(self, instrument="USDT"):
         try:
@@ -42,7 +93,7 @@ class BloFin:
             
             # get coin balance available to trade
             balance = balance["data"][0]["available"]
-            print(f"Account Balance for {instrument}: {balance}")
+            logger.debug("Account Balance for %s: %s", instrument, balance)
             return balance
         except Exception as e:
             print(f"Error fetching balance: {str(e)}")
@@ -65,7 +116,7 @@ class BloFin:
                 timeout=5,
                 inst_id=symbol
             )
-            print(f"Open Positions: {positions}")
+            logger.debug("Open Positions: %s", positions)
             return positions
         except Exception as e:
             print(f"Error fetching open positions: {str(e)}")
@@ -77,7 +128,7 @@ class BloFin:
                 timeout=5,
                 inst_id=symbol
             )
-            print(f"Open Orders: {orders}")
+            logger.debug("Open Orders: %s", orders)
             return orders
         except Exception as e:
             print(f"Error fetching open orders: {str(e)}")
@@ -85,12 +136,7 @@ class BloFin:
     async def fetch_and_map_positions(self, symbol: str):
         """Fetch open positions from BloFin and convert them to UnifiedPosition objects."""
         try:
-            response = await execute_with_timeout(
-                self.blofin_client.trading.get_positions,
-                timeout=5,
-                inst_id=symbol
-            )
-            positions = response.get("data", [])
+            positions = await self._positions_batcher.fetch(symbol)
             #print(positions)
             #quit()
 
@@ -101,81 +147,146 @@ class BloFin:
                 if float(pos.get("positions", 0)) != 0
             ]
 
-            for unified_position in unified_positions:
-                print(f"Unified Position: {unified_position}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for unified_position in unified_positions:
+                    logger.debug("Unified Position: %s", unified_position)
 
             return unified_positions
         except Exception as e:
             print(f"Error mapping BloFin positions: {str(e)}")
             return []
 
+    async def _fetch_all_positions(self):
+        """Fetch open positions for every symbol in one request."""
+        response = await execute_with_timeout(
+            self.blofin_client.trading.get_positions,
+            timeout=5
+        )
+        return response.get("data", [])
+
     def map_blofin_position_to_unified(self, position: dict) -> UnifiedPosition:
         """Convert a BloFin position response into a UnifiedPosition object."""
-        size = abs(float(position.get("positions", 0)))  # Handle both long and short positions
-        direction = "long" if float(position.get("positions", 0)) > 0 else "short"
-        # adjust size for short positions
-        if direction == "short":
-            size = -size
+        # The signed quantity already carries the direction, so parse it once
+        _get = position.get  # bound once; the mapper reads most fields through it
+        size = float(_get("positions", 0))
+        direction = "long" if size > 0 else "short"
             
         # Use provided margin mode if available, otherwise derive from tradeMode
-        margin_mode = position.get("marginMode")
+        margin_mode = _get("marginMode")
         if margin_mode is None:
             raise ValueError("Margin mode not found in position data.")
             
         return UnifiedPosition(
-            symbol=position["instId"],
+            symbol=sys.intern(position["instId"]),  # interned: the same few symbols repeat across positions
             size=size,
-            average_entry_price=float(position.get("averagePrice", 0)),
-            leverage=float(position.get("leverage", 1)),
+            average_entry_price=float(_get("averagePrice", 0)),
+            leverage=float(_get("leverage", 1)),
             direction=direction,
-            unrealized_pnl=float(position.get("unrealizedPnl", 0)),
+            unrealized_pnl=float(_get("unrealizedPnl", 0)),
             margin_mode=margin_mode,
             exchange=self.exchange_name,
         )
         
     async def fetch_tickers(self, symbol):
+        # Serve from the WebSocket stream once it is delivering this symbol
+        await self._ticker_feed.subscribe(symbol)
+        ticker = self._ticker_feed.get(symbol)
+        if ticker is not None:
+            return ticker
+        
+        # Concurrent callers asking for the same ticker share one request
+        return await single_flight((self.exchange_name, "ticker", symbol), self._fetch_ticker, symbol)
+
+    async def _fetch_ticker(self, symbol):
         try:
-            tickers = await execute_with_timeout(
-                self.blofin_client.public.get_tickers,
-                timeout=5,
-                inst_id=symbol
-            )
-            ticker_data = tickers["data"][0]  # Assuming the first entry is the relevant ticker
+            tickers = await self._ticker_batcher.fetch(symbol)
+            ticker_data = tickers[0]  # Assuming the first entry is the relevant ticker
 
-            print(f"Ticker: {ticker_data}")
-            return UnifiedTicker(
-                symbol=symbol,
-                bid=float(ticker_data.get("bidPrice", 0)),
-                ask=float(ticker_data.get("askPrice", 0)),
-                last=float(ticker_data.get("last", 0)),
-                volume=float(ticker_data.get("volCurrency24h", 0)),
-                exchange=self.exchange_name
-            )
+            logger.debug("Ticker: %s", ticker_data)
+            return self._map_ticker(symbol, ticker_data)
         except Exception as e:
             print(f"Error fetching tickers from Blofin: {str(e)}")
 
+    def _map_ticker(self, symbol: str, ticker_data: dict) -> UnifiedTicker:
+        """Convert a BloFin ticker (REST or stream) into a UnifiedTicker object."""
+        return UnifiedTicker(
+            symbol=symbol,
+            bid=float(ticker_data.get("bidPrice", 0)),
+            ask=float(ticker_data.get("askPrice", 0)),
+            last=float(ticker_data.get("last", 0)),
+            volume=float(ticker_data.get("volCurrency24h", 0)),
+            exchange=self.exchange_name
+        )
+
+    def _parse_ticker_frame(self, raw: str):
+        """Map a tickers channel push to a UnifiedTicker; ignore pongs and acks."""
+        if raw == "pong":
+            return None
+        frame = ujson.loads(raw)
+        if frame.get("arg", {}).get("channel") != "tickers" or not frame.get("data"):
+            return None
+        ticker_data = frame["data"][0]
+        return self._map_ticker(ticker_data["instId"], ticker_data)
+
+    async def _fetch_all_tickers(self):
+        """Fetch tickers for every instrument in one request."""
+        tickers = await execute_with_timeout(
+            self.blofin_client.public.get_tickers,
+            timeout=5
+        )
+        return tickers["data"]
+
     async def get_symbol_details(self, symbol: str):
         """Fetch instrument details including tick size and lot size."""
+        cached = get_cached_symbol_details(self.exchange_name, symbol)
+        if cached is not None:
+            return cached
+        
+        # On the first miss after start-up, reuse details saved to disk by an earlier run
+        if self._instrument_file_details is None:
+            self._instrument_file_details = await asyncio.to_thread(load_instrument_cache, self.exchange_name) or {}
+            for cached_symbol, details in self._instrument_file_details.items():
+                cache_symbol_details(self.exchange_name, cached_symbol, details)
+            cached = get_cached_symbol_details(self.exchange_name, symbol)
+            if cached is not None:
+                return cached
+        
         try:
-            instruments = await execute_with_timeout(
-                self.blofin_client.public.get_instruments,
-                timeout=5,
-                inst_type="SWAP"
-            )
-            for instrument in instruments["data"]:
-                if instrument["instId"] == symbol:
-                    #print(f"Symbol: {symbol} -> {instrument}")
-                    lot_size = float(instrument["lotSize"])
-                    min_size = float(instrument["minSize"])
-                    tick_size = float(instrument["tickSize"])
-                    contract_value = float(instrument["contractValue"])
-                    
-                    return lot_size, min_size, tick_size, contract_value
-            raise ValueError(f"Symbol {symbol} not found.")
+            # Every symbol comes from the same instrument list, so cold lookups share one request
+            await single_flight((self.exchange_name, "instruments", None), self._refresh_instruments)
+            
+            details = get_cached_symbol_details(self.exchange_name, symbol)
+            if details is None:
+                raise ValueError(f"Symbol {symbol} not found.")
+            return details
         except Exception as e:
             print(f"Error fetching symbol details: {str(e)}")
             return None
 
+    async def _refresh_instruments(self):
+        """Fetch every SWAP instrument, index it by instId and cache its symbol details."""
+        instruments = await execute_with_timeout(
+            self.blofin_client.public.get_instruments,
+            timeout=5,
+            inst_type="SWAP"
+        )
+        self._instruments_by_id = {instrument["instId"]: instrument for instrument in instruments["data"]}
+        details_by_symbol = {}
+        for instrument in self._instruments_by_id.values():
+            lot_size = float(instrument["lotSize"])
+            min_size = float(instrument["minSize"])
+            tick_size = float(instrument["tickSize"])
+            contract_value = float(instrument["contractValue"])
+            details_by_symbol[instrument["instId"]] = cache_symbol_details(self.exchange_name, instrument["instId"], (lot_size, min_size, tick_size, contract_value))
+        
+        self._instrument_file_details = details_by_symbol
+        # A full refresh, so it replaces everything saved earlier
+        await asyncio.to_thread(store_instrument_cache, self.exchange_name, details_by_symbol, True)
+
+    def clear_symbol_cache(self, symbol: str = None):
+        """Drop cached symbol details so the next lookup fetches them again."""
+        clear_symbol_cache(exchange=self.exchange_name, symbol=symbol)
+
     async def _place_limit_order_test(self, ):
         """Place a limit order on BloFin."""
         try:
@@ -191,13 +302,10 @@ class BloFin:
             order_type="ioc" # market: market order, limit: limit order, post_only: Post-only order, fok: Fill-or-kill order, ioc: Immediate-or-cancel order
             # time_in_force is implied in order_type
             margin_mode="isolated" # isolated, cross
-            client_order_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+            client_order_id = generate_client_oid()
             
             # Fetch and scale the size and price
-            lots, price, _ = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)
+            lots, price, _ = await self.scale_size_and_price(symbol, size, 0)
             print(f"Ordering {lots} lots @ {price}")
             #quit()
             
@@ -214,7 +322,7 @@ class BloFin:
                 margin_mode=margin_mode,
                 clientOrderId=client_order_id,
             )
-            print(f"Limit Order Placed: {order}")
+            logger.debug("Limit Order Placed: %s", order)
             # Limit Order Placed: {'code': '0', 'msg': '', 'data': [{'orderId': '1000012973229', 'clientOrderId': '20241014022135830998', 'msg': 'success', 'code': '0'}]}
         except Exception as e:
             print(f"Error placing limit order: {str(e)}")
@@ -222,13 +330,10 @@ class BloFin:
     async def open_market_position(self, symbol: str, side: str, size: float, leverage: int, margin_mode: str, scale_lot_size: bool = True):
         """Open a position with a market order on BloFin."""
         try:
-            client_order_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+            client_order_id = generate_client_oid()
 
             # Fetch and scale the size
-            lots = (scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value))[0] if scale_lot_size else size
+            lots = (await self.scale_size_and_price(symbol, size, 0))[0] if scale_lot_size else size
             print(f"Processing {lots} lots of {symbol} with market order")
 
             # Place the market order
@@ -245,7 +350,7 @@ class BloFin:
                 margin_mode=margin_mode,
                 clientOrderId=client_order_id
             )
-            print(f"Market Order Placed: {order}")
+            logger.debug("Market Order Placed: %s", order)
             return order
 
         except Exception as e:
@@ -272,7 +377,7 @@ class BloFin:
             print(f"Closing {size} lots of {symbol} with a market order.")
 
             # Place a market order in the opposite direction to close the position
-            client_order_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+            client_order_id = generate_client_oid()
             order = await execute_with_timeout(
                 self.blofin_client.trading.place_order,
                 timeout=5,
@@ -288,7 +393,7 @@ class BloFin:
                 scale_lot_size=False  # Do not scale the lot size for closing
             )
 
-            print(f"Position Closed: {order}")
+            logger.debug("Position Closed: %s", order)
             return order
             
         except Exception as e:
@@ -301,13 +406,10 @@ class BloFin:
         try:
             unified_positions = await self.fetch_and_map_positions(symbol)
             current_position = unified_positions[0] if unified_positions else None
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
 
             #if size != 0:
             # Always scale as we need lot_size
-            size, _, lot_size = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)  # No price for market orders
+            size, _, lot_size = await self.scale_size_and_price(symbol, size, 0)  # No price for market orders
 
             # Initialize position state variables
             current_size = current_position.size if current_position else 0
@@ -380,11 +482,9 @@ class BloFin:
             for symbol in test_symbols:
                 try:
                     # Get instrument info
-                    instrument = await execute_with_timeout(
-                        self.blofin_client.public.get_instruments,
-                        timeout=5,
-                        inst_type="SWAP"
-                    )
+                    if symbol not in self._instruments_by_id:
+                        await self._refresh_instruments()
+                    instrument = self._instruments_by_id.get(symbol)
                     
                     print(f"\nBloFin Symbol Information for {symbol}:")
                     print(f"Native Symbol Format: {symbol}")
@@ -443,7 +543,7 @@ class BloFin:
 
 async def main():
     # Start a time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter_ns()
     
     blofin = BloFin()
     
@@ -465,8 +565,7 @@ async def main():
     # )
     # print(order_results)
     
-    # import time
-    # time.sleep(5)
+    # await asyncio.sleep(5)
 
     # Example usage of reconcile_position to adjust position to the desired size, leverage, and margin type
     #await blofin.reconcile_position(
@@ -508,8 +607,8 @@ async def main():
     print(f"Final Total Account Value: {total_value} USDT")
     
     # End time
-    end_time = datetime.datetime.now()
-    print(f"Time taken: {end_time - start_time}")
+    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+    print(f"Time taken: {elapsed_ms:.3f} ms")
     
 if __name__ == "__main__":
     asyncio.run(main())
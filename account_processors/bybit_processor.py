@@ -1,14 +1,18 @@
 import asyncio
-import datetime
+import time
+import sys
 from pybit.unified_trading import HTTP # https://github.com/bybit-exchange/pybit/
 from config.credentials import load_bybit_credentials
-from core.utils.modifiers import scale_size_and_price
+from core.mixins.scaling import ScalingMixin
 from core.unified_position import UnifiedPosition
 from core.unified_ticker import UnifiedTicker
 from core.utils.execute_timed import execute_with_timeout
+from core.utils.client_oid import generate_client_oid
+from core.utils.symbol_cache import get_cached_symbol_details, cache_symbol_details, clear_symbol_cache
+from core.utils.single_flight import single_flight
 
 
-class ByBit:
+class ByBit(ScalingMixin):
     def __init__(self):
         
         self.exchange_name = "ByBit"
@@ -154,30 +158,35 @@ class ByBit:
     
     def map_bybit_position_to_unified(self, position: dict, margin_mode: str = None) -> UnifiedPosition:
         """Convert a Bybit position response into a UnifiedPosition object."""
-        size = abs(float(position.get("size", 0)))
-        direction = "long" if position.get("side", "").lower() == "buy" else "short"
+        _get = position.get  # bound once; the mapper reads most fields through it
+        size = abs(float(_get("size", 0)))
+        direction = "long" if _get("side", "").lower() == "buy" else "short"
         # adjust size for short positions
         if direction == "short":
             size = -size
 
         # Use provided margin mode if available, otherwise derive from tradeMode
-        margin_mode = margin_mode or ("isolated" if position.get("tradeMode") == 1 else "cross")
+        margin_mode = margin_mode or ("isolated" if _get("tradeMode") == 1 else "cross")
         
         # User inverse mapping to convert margin mode to unified format
         margin_mode = self.inverse_margin_mode_map.get(margin_mode, margin_mode)
 
         return UnifiedPosition(
-            symbol=position["symbol"],
+            symbol=sys.intern(position["symbol"]),  # interned: the same few symbols repeat across positions
             size=size,
-            average_entry_price=float(position.get("avgPrice", 0)),
-            leverage=float(position.get("leverage", 1)),
+            average_entry_price=float(_get("avgPrice", 0)),
+            leverage=float(_get("leverage", 1)),
             direction=direction,
-            unrealized_pnl=float(position.get("unrealisedPnl", 0)),
+            unrealized_pnl=float(_get("unrealisedPnl", 0)),
             margin_mode=margin_mode,
             exchange=self.exchange_name,
         )
         
     async def fetch_tickers(self, symbol):
+        # Concurrent callers asking for the same ticker share one request
+        return await single_flight((self.exchange_name, "ticker", symbol), self._fetch_ticker, symbol)
+
+    async def _fetch_ticker(self, symbol):
         try:
             tickers = await execute_with_timeout(
                 self.bybit_client.get_tickers,
@@ -201,6 +210,14 @@ class ByBit:
 
     async def get_symbol_details(self, symbol: str):
         """Fetch instrument details including tick size, lot size, min size, and contract value."""
+        cached = get_cached_symbol_details(self.exchange_name, symbol)
+        if cached is not None:
+            return cached
+        
+        # Concurrent cold lookups for the same symbol share one request
+        return await single_flight((self.exchange_name, "symbol_details", symbol), self._fetch_symbol_details, symbol)
+
+    async def _fetch_symbol_details(self, symbol: str):
         instruments = await execute_with_timeout(
             self.bybit_client.get_instruments_info,
             timeout=5,
@@ -216,9 +233,13 @@ class ByBit:
                 tick_size = float(instrument["priceFilter"]["tickSize"])
                 contract_value = float(lot_size / min_size)  # Optional fallback
 
-                return lot_size, min_size, tick_size, contract_value
+                return cache_symbol_details(self.exchange_name, symbol, (lot_size, min_size, tick_size, contract_value))
         raise ValueError(f"Symbol {symbol} not found.")
 
+    def clear_symbol_cache(self, symbol: str = None):
+        """Drop cached symbol details so the next lookup fetches them again."""
+        clear_symbol_cache(exchange=self.exchange_name, symbol=symbol)
+
     async def _place_limit_order_test(self,):
         """Place a limit order on Bybit."""
         try:
@@ -240,13 +261,10 @@ class ByBit:
             bybit_margin_mode='ISOLATED_MARGIN' # ISOLATED_MARGIN, REGULAR_MARGIN(i.e. Cross margin), PORTFOLIO_MARGIN
             reduce_only=False
             close_on_trigger=False
-            client_oid = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+            client_oid = generate_client_oid()
             
             # Fetch and scale the size and price
-            lots, price, _ = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)
+            lots, price, _ = await self.scale_size_and_price(symbol, size, 0)
             print(f"Ordering {lots} lots @ {price}")
             #quit()
             
@@ -301,11 +319,8 @@ class ByBit:
         """Open a position with a market order."""
         try:
             
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
-            
-            client_oid = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            lots = (scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value))[0] if scale_lot_size else size
+            client_oid = generate_client_oid()
+            lots = (await self.scale_size_and_price(symbol, size, 0))[0] if scale_lot_size else size
             print(f"Processing {lots} lots of {symbol} with a {side} order.")
 
             if adjust_margin_mode:
@@ -392,14 +407,11 @@ class ByBit:
             # Fetch current positions for the given symbol
             unified_positions = await self.fetch_and_map_positions(symbol, fetch_margin_mode=size != 0)
             current_position = unified_positions[0] if unified_positions else None
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
 
             # Scale the target size to match exchange requirements
             #if size != 0:
             # Always scale as we need lot_size
-            size, _, lot_size = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)  # No price needed for market orders
+            size, _, lot_size = await self.scale_size_and_price(symbol, size, 0)  # No price needed for market orders
 
             # Initialize current state variables
             current_size = current_position.size if current_position else 0
@@ -541,7 +553,7 @@ class ByBit:
 
 async def main():   
     # Start a time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter_ns()
     
     bybit = ByBit()
     
@@ -563,8 +575,7 @@ async def main():
     # )
     # print(order_results)
     
-    # import time
-    # time.sleep(5)
+    # await asyncio.sleep(5)
     
     
     # Example usage of reconcile_position to adjust position to the desired size, leverage, and margin type
@@ -594,8 +605,8 @@ async def main():
     print(f"Final Initial Account Value: {initial_value} USDT")
     
     # End time
-    end_time = datetime.datetime.now()
-    print(f"Time taken: {end_time - start_time}")
+    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+    print(f"Time taken: {elapsed_ms:.3f} ms")
     
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,14 +1,18 @@
 import asyncio
-import datetime
+import time
+import sys
 from kucoin_futures.client import UserData, Trade, Market # https://github.com/Kucoin/kucoin-futures-python-sdk
 from config.credentials import load_kucoin_credentials
-from core.utils.modifiers import scale_size_and_price
+from core.mixins.scaling import ScalingMixin
 from core.unified_position import UnifiedPosition
 from core.unified_ticker import UnifiedTicker
 from core.utils.execute_timed import execute_with_timeout
+from core.utils.client_oid import generate_client_oid
+from core.utils.symbol_cache import get_cached_symbol_details, cache_symbol_details, clear_symbol_cache
+from core.utils.single_flight import single_flight
 
 
-class KuCoin:
+class KuCoin(ScalingMixin):
     def __init__(self):
         self.exchange_name = "KuCoin"
         self.enabled = True
@@ -118,34 +122,48 @@ class KuCoin:
             
     def map_kucoin_position_to_unified(self, position: dict) -> UnifiedPosition:
         """Convert a KuCoin position response into a UnifiedPosition object."""
-        size = abs(float(position.get("currentQty", 0)))  # Handle long/short positions
-        direction = "long" if float(position.get("currentQty", 0)) > 0 else "short"
-        # adjust size for short positions
-        if direction == "short":
-            size = -size
+        # The signed quantity already carries the direction, so parse it once
+        _get = position.get  # bound once; the mapper reads most fields through it
+        size = float(_get("currentQty", 0))
+        direction = "long" if size > 0 else "short"
             
         # Use provided margin mode if available, otherwise derive from tradeMode
-        kucoin_margin_mode = position.get("marginMode")
+        kucoin_margin_mode = _get("marginMode")
         if kucoin_margin_mode is None:
             raise ValueError("Margin mode not found in position data.")
         
         margin_mode = self.inverse_margin_mode_map.get(kucoin_margin_mode, kucoin_margin_mode)
             
         return UnifiedPosition(
-            symbol=position["symbol"],
+            symbol=sys.intern(position["symbol"]),  # interned: the same few symbols repeat across positions
             size=size,
-            average_entry_price=float(position.get("avgEntryPrice", 0)),
-            leverage=float(position.get("leverage", 1)),
+            average_entry_price=float(_get("avgEntryPrice", 0)),
+            leverage=float(_get("leverage", 1)),
             direction=direction,
-            unrealized_pnl=float(position.get("unrealisedPnl", 0)),
+            unrealized_pnl=float(_get("unrealisedPnl", 0)),
             margin_mode=margin_mode,
             exchange=self.exchange_name,
         )
         
     async def fetch_tickers(self, symbol):
+        # Concurrent callers asking for the same ticker share one request
+        return await single_flight((self.exchange_name, "ticker", symbol), self._fetch_ticker, symbol)
+
+    async def _fetch_ticker(self, symbol):
         try:
-            tickers = self.market_client.get_ticker(symbol=symbol)
-            contract = self.market_client.get_contract_detail(symbol=symbol)
+            # Ticker and contract detail are independent requests, so run them side by side
+            tickers, contract = await asyncio.gather(
+                execute_with_timeout(
+                    self.market_client.get_ticker,
+                    timeout=5,
+                    symbol=symbol
+                ),
+                execute_with_timeout(
+                    self.market_client.get_contract_detail,
+                    timeout=5,
+                    symbol=symbol
+                ),
+            )
             
             print(f"Tickers: {tickers}")
             return UnifiedTicker(
@@ -161,8 +179,20 @@ class KuCoin:
 
     async def get_symbol_details(self, symbol: str):
         """Fetch instrument details including tick size, lot size, and contract value."""
+        cached = get_cached_symbol_details(self.exchange_name, symbol)
+        if cached is not None:
+            return cached
+        
+        # Concurrent cold lookups for the same symbol share one request
+        return await single_flight((self.exchange_name, "symbol_details", symbol), self._fetch_symbol_details, symbol)
+
+    async def _fetch_symbol_details(self, symbol: str):
         # Fetch the instrument details from the market client
-        instrument = self.market_client.get_contract_detail(symbol)
+        instrument = await execute_with_timeout(
+            self.market_client.get_contract_detail,
+            timeout=5,
+            symbol=symbol
+        )
 
         # Check if the response contains the desired symbol
         if instrument["symbol"] == symbol:
@@ -171,8 +201,12 @@ class KuCoin:
             tick_size = float(instrument["tickSize"])    # Tick size for price
             contract_value = float(instrument["multiplier"])  # Contract value/multiplier
 
-            return lot_size, min_lots, tick_size, contract_value
+            return cache_symbol_details(self.exchange_name, symbol, (lot_size, min_lots, tick_size, contract_value))
         raise ValueError(f"Symbol {symbol} not found.")
+
+    def clear_symbol_cache(self, symbol: str = None):
+        """Drop cached symbol details so the next lookup fetches them again."""
+        clear_symbol_cache(exchange=self.exchange_name, symbol=symbol)
     
     async def _place_limit_order_test(self, ):
         """Place a limit order on KuCoin Futures."""
@@ -188,13 +222,10 @@ class KuCoin:
             order_type="limit" # limit or market
             time_in_force="IOC" # GTC, GTT, IOC, FOK (IOC as FOK has unexpected behavior)
             kucoin_margin_mode="ISOLATED" # ISOLATED, CROSS, default: ISOLATED
-            client_oid = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+            client_oid = generate_client_oid()
 
             # Fetch and scale the size and price
-            lots, price, _ = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)
+            lots, price, _ = await self.scale_size_and_price(symbol, size, 0)
             print(f"Ordering {lots} lots @ {price}")
             #quit()
             
@@ -232,13 +263,10 @@ class KuCoin:
         try:
             print(f"HERE: Opening a {side} position for {size} lots of {symbol} with {leverage}x leverage.")
             
-            client_oid = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+            client_oid = generate_client_oid()
             
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
-
             # If the size is already in lot size, don't scale it
-            lots = (scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value))[0] if scale_lot_size else size
+            lots = (await self.scale_size_and_price(symbol, size, 0))[0] if scale_lot_size else size
             print(f"Processing {lots} lots of {symbol} with a {side} order")
             
             kucoin_margin_mode = self.margin_mode_map.get(margin_mode, margin_mode)
@@ -311,14 +339,11 @@ class KuCoin:
         try:
             unified_positions = await self.fetch_and_map_positions(symbol)
             current_position = unified_positions[0] if unified_positions else None
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
 
             # Scale the target size to match exchange requirements
             #if size != 0:
             # Always scale as we need lot_size
-            size, _, lot_size = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)
+            size, _, lot_size = await self.scale_size_and_price(symbol, size, 0)
 
             # Initialize position state variables
             current_size = current_position.size if current_position else 0
@@ -462,7 +487,7 @@ class KuCoin:
 async def main():
     
     # Start a time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter_ns()
     
     kucoin = KuCoin()
     
@@ -485,8 +510,7 @@ async def main():
     # )
     # print(open_order)
 
-    # import time
-    # time.sleep(5)  # Wait for a bit to ensure the order is processed
+    # await asyncio.sleep(5)  # Wait for a bit to ensure the order is processed
 
     # Example usage of reconcile_position to adjust position to the desired size, leverage, and margin type
     #await kucoin.reconcile_position(
@@ -516,8 +540,8 @@ async def main():
     print(f"Final Total Account Value: {total_value} USDT")
     
     # End time
-    end_time = datetime.datetime.now()
-    print(f"Time taken: {end_time - start_time}")
+    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+    print(f"Time taken: {elapsed_ms:.3f} ms")
     
 if __name__ == "__main__":
     asyncio.run(main())
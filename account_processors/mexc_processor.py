@@ -1,14 +1,42 @@
 import asyncio
-import datetime
+import time
+import sys
+import functools
+import operator
+import ujson
+import logging
 from pymexc import futures
 from config.credentials import load_mexc_credentials
-from core.utils.modifiers import scale_size_and_price
+from core.mixins.scaling import ScalingMixin
 from core.unified_position import UnifiedPosition
 from core.unified_ticker import UnifiedTicker
 from core.utils.execute_timed import execute_with_timeout
-
-
-class MEXC:
+from core.utils.client_oid import generate_client_oid
+from core.utils.symbol_cache import get_cached_symbol_details, cache_symbol_details, clear_symbol_cache
+from core.utils.instrument_cache import load_instrument_cache, store_instrument_cache
+from core.utils.single_flight import single_flight
+from core.utils.symbol_batcher import SymbolBatcher
+from core.utils.ws_ticker_feed import WSTickerFeed
+from core.utils.http_pool import pooled_session
+
+
+logger = logging.getLogger(__name__)
+MEXC_CONTRACT_WS_URL = "wss://contract.mexc.com/edge"  # futures market data stream
+_contract_symbol = operator.itemgetter("symbol")  # built once; pulls the symbol out of bulk ticker/position rows in C
+
+@functools.lru_cache(maxsize=1)
+def _get_mexc_client(api_key: str, api_secret: str) -> futures.HTTP:
+    """Build the MEXC Futures client once and share it across the process."""
+    client = futures.HTTP(
+        api_key=api_key, 
+        api_secret=api_secret
+    )
+    # Widen the SDK's own requests session so concurrent calls reuse keep-alive connections
+    pooled_session(client.session)
+    return client
+
+
+class MEXC(ScalingMixin):
     def __init__(self):
         
         self.exchange_name = "MEXC"
@@ -17,10 +45,10 @@ class MEXC:
         # Load MEXC Futures API credentials from the credentials file
         self.credentials = load_mexc_credentials()
 
-        # Initialize MEXC Futures client
-        self.futures_client = futures.HTTP(
-            api_key=self.credentials.mexc.api_key, 
-            api_secret=self.credentials.mexc.api_secret
+        # Reuse the process-wide MEXC Futures client
+        self.futures_client = _get_mexc_client(
+            self.credentials.mexc.api_key,
+            self.credentials.mexc.api_secret
         )
         
         self.margin_mode_map = {
@@ -30,6 +58,25 @@ class MEXC:
 
         self.inverse_margin_mode_map = {v: k for k, v in self.margin_mode_map.items()}
 
+        # Symbol details persisted between runs; loaded lazily on the first cache miss
+        self._instrument_file_details: dict | None = None
+
+        # Per-symbol lookups made close together are served from one bulk request
+        self._ticker_batcher = SymbolBatcher(self._fetch_all_tickers, key=_contract_symbol)
+        self._positions_batcher = SymbolBatcher(self._fetch_all_positions, key=_contract_symbol)
+
+        # Streamed tickers, with REST covering symbols the stream hasn't delivered yet
+        self._ticker_feed = WSTickerFeed(
+            MEXC_CONTRACT_WS_URL,
+            subscribe_message=lambda symbol: ujson.dumps({"method": "sub.ticker", "param": {"symbol": symbol}}),
+            parse_frame=self._parse_ticker_frame,
+            ping_message=ujson.dumps({"method": "ping"})
+        )
+
+    async def aclose(self):
+        """Stop the ticker stream; call once at program exit."""
+        await self._ticker_feed.close()
+
     async def fetch_balance(self, instrument="USDT"):
         """Fetch the futures account balance for a specific instrument."""
         try:
@@ -48,7 +95,7 @@ class MEXC:
             balance = balance.get("data", {})
             balance = balance.get("availableBalance", 0)
 
-            print(f"Account Balance for {instrument}: {balance}")
+            logger.debug("Account Balance for %s: %s", instrument, balance)
             return balance
         except Exception as e:
             print(f"Error fetching balance: {str(e)}")
@@ -74,7 +121,7 @@ class MEXC:
                 timeout=5,
                 symbol=symbol
             )
-            print(f"Open Positions: {positions}")
+            logger.debug("Open Positions: %s", positions)
             return positions.get("data", [])
         except Exception as e:
             print(f"Error fetching open positions: {str(e)}")
@@ -87,7 +134,7 @@ class MEXC:
                 timeout=5,
                 symbol=symbol
             )
-            print(f"Open Orders: {response}")
+            logger.debug("Open Orders: %s", response)
             return response.get("data", [])
         except Exception as e:
             print(f"Error fetching open orders: {str(e)}")
@@ -95,12 +142,7 @@ class MEXC:
     async def fetch_and_map_positions(self, symbol: str):
         """Fetch and map MEXC positions to UnifiedPosition."""
         try:
-            response = await execute_with_timeout(
-                self.futures_client.open_positions,
-                timeout=5,
-                symbol=symbol
-            )
-            positions = response.get("data", [])
+            positions = await self._positions_batcher.fetch(symbol)
 
             unified_positions = [
                 self.map_mexc_position_to_unified(pos) 
@@ -108,67 +150,122 @@ class MEXC:
                 if float(pos.get("vol", 0)) != 0
             ]
 
-            for unified_position in unified_positions:
-                print(f"Unified Position: {unified_position}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for unified_position in unified_positions:
+                    logger.debug("Unified Position: %s", unified_position)
 
             return unified_positions
         except Exception as e:
             print(f"Error mapping MEXC positions: {str(e)}")
             return []
 
+    async def _fetch_all_positions(self):
+        """Fetch open positions for every symbol in one request."""
+        response = await execute_with_timeout(
+            self.futures_client.open_positions,
+            timeout=5,
+            symbol=None
+        )
+        return response.get("data", [])
+
     def map_mexc_position_to_unified(self, position: dict) -> UnifiedPosition:
         """Convert a MEXC position response into a UnifiedPosition object."""
-        size = abs(float(position.get("vol", 0)))
-        direction = "long" if int(position.get("posSide", 1)) == 1 else "short"
+        _get = position.get  # bound once; the mapper reads most fields through it
+        size = abs(float(_get("vol", 0)))
+        direction = "long" if int(_get("posSide", 1)) == 1 else "short"
         # adjust size for short positions
         if direction == "short":
             size = -size
             
         # Use provided margin mode if available, otherwise derive from tradeMode
-        mexc_margin_mode = position.get("open_type")
+        mexc_margin_mode = _get("open_type")
         if mexc_margin_mode is None:
             raise ValueError("Margin mode not found in position data.")
         
         margin_mode = self.margin_mode_map.get(mexc_margin_mode, mexc_margin_mode)
         
         return UnifiedPosition(
-            symbol=position["symbol"],
+            symbol=sys.intern(position["symbol"]),  # interned: the same few symbols repeat across positions
             size=size,
-            average_entry_price=float(position.get("avgPrice", 0)),
-            leverage=float(position.get("leverage", 1)),
+            average_entry_price=float(_get("avgPrice", 0)),
+            leverage=float(_get("leverage", 1)),
             direction=direction,
-            unrealized_pnl=float(position.get("unrealizedPnl", 0)),
+            unrealized_pnl=float(_get("unrealizedPnl", 0)),
             margin_mode=margin_mode,
             exchange=self.exchange_name,
         )
         
     async def fetch_tickers(self, symbol):
+        # Serve from the WebSocket stream once it is delivering this symbol
+        await self._ticker_feed.subscribe(symbol)
+        ticker = self._ticker_feed.get(symbol)
+        if ticker is not None:
+            return ticker
+
+        # Concurrent callers asking for the same ticker share one request
+        return await single_flight((self.exchange_name, "ticker", symbol), self._fetch_ticker, symbol)
+
+    async def _fetch_ticker(self, symbol):
         try:
-            ticker = await execute_with_timeout(
-                self.futures_client.ticker,
-                timeout=5,
-                symbol=symbol
-            )
-            ticker_data = ticker.get("data", {})
-            
-            # Quantity traded in the last 24 hours
-            amount24 = float(ticker_data.get("amount24", 0))
-            lastPrice = float(ticker_data.get("lastPrice", 0))
+            tickers = await self._ticker_batcher.fetch(symbol)
+            ticker_data = tickers[0] if tickers else {}
 
-            print(f"Ticker: {ticker_data}")
-            return UnifiedTicker(
-                symbol=symbol,
-                bid=float(ticker_data.get("bid1", 0)),
-                ask=float(ticker_data.get("ask1", 0)),
-                last=float(ticker_data.get("lastPrice", 0)),
-                volume=float(amount24 / lastPrice),
-                exchange=self.exchange_name
-            )
+            logger.debug("Ticker: %s", ticker_data)
+            return self._map_ticker(symbol, ticker_data)
         except Exception as e:
             print(f"Error fetching tickers from MEXC: {str(e)}")
 
+    def _map_ticker(self, symbol: str, ticker_data: dict) -> UnifiedTicker:
+        """Convert a MEXC ticker (REST or stream) into a UnifiedTicker object."""
+        # Quantity traded in the last 24 hours
+        amount24 = float(ticker_data.get("amount24", 0))
+        lastPrice = float(ticker_data.get("lastPrice", 0))
+
+        return UnifiedTicker(
+            symbol=symbol,
+            bid=float(ticker_data.get("bid1", 0)),
+            ask=float(ticker_data.get("ask1", 0)),
+            last=float(ticker_data.get("lastPrice", 0)),
+            volume=float(amount24 / lastPrice),
+            exchange=self.exchange_name
+        )
+
+    def _parse_ticker_frame(self, raw: str):
+        """Map a push.ticker frame to a UnifiedTicker; ignore pongs and acks."""
+        frame = ujson.loads(raw)
+        if frame.get("channel") != "push.ticker" or not frame.get("data"):
+            return None
+        ticker_data = frame["data"]
+        return self._map_ticker(ticker_data["symbol"], ticker_data)
+
+    async def _fetch_all_tickers(self):
+        """Fetch tickers for every contract in one request."""
+        ticker = await execute_with_timeout(
+            self.futures_client.ticker,
+            timeout=5,
+            symbol=None
+        )
+        return ticker.get("data", [])
+
     async def get_symbol_details(self, symbol: str):
         """Fetch instrument details including lot size, min size, tick size, and contract value."""
+        cached = get_cached_symbol_details(self.exchange_name, symbol)
+        if cached is not None:
+            return cached
+        
+        # On the first miss after start-up, reuse details saved to disk by an earlier run
+        if self._instrument_file_details is None:
+            self._instrument_file_details = await asyncio.to_thread(load_instrument_cache, self.exchange_name) or {}
+            for cached_symbol, details in self._instrument_file_details.items():
+                cache_symbol_details(self.exchange_name, cached_symbol, details)
+            cached = get_cached_symbol_details(self.exchange_name, symbol)
+            if cached is not None:
+                return cached
+        
+        # Concurrent cold lookups for the same symbol share one request
+        return await single_flight((self.exchange_name, "symbol_details", symbol), self._fetch_symbol_details, symbol)
+
+    async def _fetch_symbol_details(self, symbol: str):
         try:
             # Fetch all contract details for the given symbol
             response = await execute_with_timeout(
@@ -192,7 +289,11 @@ class MEXC:
             tick_size = float(instrument["priceUnit"])       # Minimum price change (e.g., 0.1 USDT)
             contract_value = float(instrument["contractSize"])  # Value per contract
 
-            return lot_size, min_lots, tick_size, contract_value
+            details = cache_symbol_details(self.exchange_name, symbol, (lot_size, min_lots, tick_size, contract_value))
+            self._instrument_file_details[symbol] = details
+            # Only this contract is new, so only its saved timestamp is restarted
+            await asyncio.to_thread(store_instrument_cache, self.exchange_name, {symbol: details})
+            return details
 
         except KeyError as e:
             raise ValueError(f"Missing expected key: {e}") from e
@@ -200,6 +301,10 @@ class MEXC:
         except Exception as e:
             print(f"Error fetching symbol details: {str(e)}")
             return None
+
+    def clear_symbol_cache(self, symbol: str = None):
+        """Drop cached symbol details so the next lookup fetches them again."""
+        clear_symbol_cache(exchange=self.exchange_name, symbol=symbol)
     
     async def _place_limit_order_test(self, ):
         """Place a limit order on MEXC Futures."""
@@ -213,13 +318,10 @@ class MEXC:
             leverage=3
             order_type=1 # Limit order
             mex_margin_mode=1 # 1:isolated 2:cross
-            client_oid = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+            client_oid = generate_client_oid()
 
             # Fetch and scale the size and price
-            lots, price, _ = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)
+            lots, price, _ = await self.scale_size_and_price(symbol, size, 0)
             print(f"Ordering {lots} lots @ {price}")
             #quit()
             
@@ -235,20 +337,17 @@ class MEXC:
                 leverage=leverage,
                 external_oid=client_oid
             )
-            print(f"Limit Order Placed: {order}")
+            logger.debug("Limit Order Placed: %s", order)
         except Exception as e:
             print(f"Error placing limit order: {str(e)}")
         
     async def open_market_position(self, symbol: str, side: str, size: float, leverage: int, margin_mode: str, scale_lot_size: bool = True):
         """Open a market position."""
         try:
-            client_oid = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
-            
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+            client_oid = generate_client_oid()
             
             # If the size is already in lot size, don't scale it
-            lots = (scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value))[0] if scale_lot_size else size
+            lots = (await self.scale_size_and_price(symbol, size, 0))[0] if scale_lot_size else size
             print(f"Processing {lots} lots of {symbol} with a {side} order")
             
             mexc_margin_mode = self.margin_mode_map.get(margin_mode, margin_mode)
@@ -265,7 +364,7 @@ class MEXC:
                 leverage=leverage,
                 external_oid=client_oid
             )
-            print(f"Market Order Placed: {order}")
+            logger.debug("Market Order Placed: %s", order)
             return order
 
         except Exception as e:
@@ -296,12 +395,9 @@ class MEXC:
             unified_positions = await self.fetch_and_map_positions(symbol)
             current_position = unified_positions[0] if unified_positions else None
             
-            # Fetch symbol details (e.g., contract value, lot size, tick size)
-            lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
-            
             #if size != 0:
             # Always scale as we need lot_size
-            size, _, lot_size = scale_size_and_price(symbol, size, 0, lot_size, min_lots, tick_size, contract_value)  # No price for market orders
+            size, _, lot_size = await self.scale_size_and_price(symbol, size, 0)  # No price for market orders
 
             # Initialize position state variables
             current_size = current_position.size if current_position else 0
@@ -439,7 +535,7 @@ class MEXC:
 async def main():
     
     # Start a time
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter_ns()
     
     mexc = MEXC()
     
@@ -460,8 +556,7 @@ async def main():
     # )
     # print(open_order)
 
-    # import time
-    # time.sleep(5)  # Wait for a bit to ensure the order is processed
+    # await asyncio.sleep(5)  # Wait for a bit to ensure the order is processed
     
     # Example usage of reconcile_position to adjust position to the desired size, leverage, and margin type
     #await mexc.reconcile_position(
@@ -491,8 +586,8 @@ async def main():
     print(f"Final Total Account Value: {total_value} USDT")
     
     # End time
-    end_time = datetime.datetime.now()
-    print(f"Time taken: {end_time - start_time}")
+    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+    print(f"Time taken: {elapsed_ms:.3f} ms")
 
 
 if __name__ == "__main__":
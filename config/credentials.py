@@ -1,33 +1,33 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
-@dataclass
+@dataclass(slots=True)
 class BittensorCredentials:
     api_key: str
     endpoint: str
 
-@dataclass
+@dataclass(slots=True)
 class BybitCredentials:
     api_key: str
     api_secret: str
 
-@dataclass
+@dataclass(slots=True)
 class BloFinCredentials:
     api_key: str
     api_secret: str
     api_passphrase: str
 
-@dataclass
+@dataclass(slots=True)
 class KuCoinCredentials:
     api_key: str
     api_secret: str
     api_passphrase: str
     
-@dataclass
+@dataclass(slots=True)
 class MEXCCredentials:
     api_key: str
     api_secret: str
 
-@dataclass
+@dataclass(slots=True)
 class Credentials:
     bittensor_sn8: BittensorCredentials
     bybit: BybitCredentials
@@ -36,6 +36,7 @@ class Credentials:
     mexc: MEXCCredentials
 
 
+import functools
 import ujson
 import os
 
@@ -90,11 +91,11 @@ def load_credentials(file_path: str) -> Credentials:
 def save_credentials(credentials: Credentials, file_path: str):
     """Save credentials to a JSON file."""
     data = {
-        'bittensor_sn8': credentials.bittensor_sn8.__dict__ if credentials.bittensor_sn8 else None,
-        'bybit': credentials.bybit.__dict__ if credentials.bybit else None,
-        'blofin': credentials.blofin.__dict__ if credentials.blofin else None,
-        'kucoin': credentials.kucoin.__dict__ if credentials.kucoin else None,
-        'mexc': credentials.mexc.__dict__ if credentials.mexc else None,
+        'bittensor_sn8': asdict(credentials.bittensor_sn8) if credentials.bittensor_sn8 else None,
+        'bybit': asdict(credentials.bybit) if credentials.bybit else None,
+        'blofin': asdict(credentials.blofin) if credentials.blofin else None,
+        'kucoin': asdict(credentials.kucoin) if credentials.kucoin else None,
+        'mexc': asdict(credentials.mexc) if credentials.mexc else None,
     }
     with open(file_path, 'w', encoding='utf-8') as f:
         ujson.dump(data, f, indent=4)
@@ -200,6 +201,9 @@ def ensure_mexc_credentials(credentials: Credentials, skip_prompt: bool = False)
     return credentials
 
 
+# Credentials are process-global, so each loader reads and validates the file once and
+# returns the same instance afterwards; callers must treat it as read-only
+@functools.lru_cache(maxsize=1)
 def load_bittensor_credentials():
     """Ensure all credentials are present, and load them if necessary."""
     credentials = load_credentials(CREDENTIALS_FILE)
@@ -207,6 +211,7 @@ def load_bittensor_credentials():
     
     return credentials
 
+@functools.lru_cache(maxsize=1)
 def load_bybit_credentials():
     """Ensure all credentials are present, and load them if necessary."""
     credentials = load_credentials(CREDENTIALS_FILE)
@@ -214,18 +219,21 @@ def load_bybit_credentials():
     
     return credentials
 
+@functools.lru_cache(maxsize=1)
 def load_blofin_credentials():
     """Ensure all BloFin credentials are present, and load them if necessary."""
     credentials = load_credentials(CREDENTIALS_FILE)
     assert ensure_blofin_credentials(credentials, skip_prompt=True)
     return credentials
 
+@functools.lru_cache(maxsize=1)
 def load_kucoin_credentials():
     """Ensure all KuCoin credentials are present, and load them if necessary."""
     credentials = load_credentials(CREDENTIALS_FILE)
     assert ensure_kucoin_credentials(credentials, skip_prompt=True)
     return credentials
 
+@functools.lru_cache(maxsize=1)
 def load_mexc_credentials() -> Credentials:
     """Ensure all MEXC credentials are present, and load them if necessary."""
     credentials = load_credentials(CREDENTIALS_FILE)
@@ -1,8 +1,11 @@
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from typing import List, Optional, Dict
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BTTSN8TradePair:
     symbol: str
     original_symbol: str
@@ -11,8 +14,13 @@ class BTTSN8TradePair:
     volume: float
     decimal_places: int
 
+    def __post_init__(self):
+        # Every order and position repeats the same few pairs, so share one string object per value
+        object.__setattr__(self, "symbol", sys.intern(self.symbol))
+        object.__setattr__(self, "pair", sys.intern(self.pair))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BTTSN8Order:
     leverage: float
     order_type: str  # "LONG", "SHORT", "LIMIT", "MARKET", etc.
@@ -24,7 +32,7 @@ class BTTSN8Order:
     trade_pair: BTTSN8TradePair
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BTTSN8Position:
     depth: float
     average_entry_price: float
@@ -41,10 +49,21 @@ class BTTSN8Position:
     trade_pair: BTTSN8TradePair
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BTTSN8MinerSignal:
     all_time_returns: float
     n_positions: int
     percentage_profitable: float
     positions: List[BTTSN8Position]
     thirty_day_returns: Optional[float]  # Optional for time-based signals
+
+
+@dataclass(slots=True, frozen=True)
+class BTTSN8MinerStats:
+    """Per-miner figures computed once while filtering and reused when scoring."""
+    position_returns: np.ndarray  # return - 1 per position: realised if closed, current if open
+    profitable: int
+    total: int
+    latest_trade: int  # close_ms of the most recent closed position, 0 if none
+    max_drawdown: float
+    asset_counts: Dict[str, int]
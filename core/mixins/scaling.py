@@ -0,0 +1,21 @@
+import functools
+from core.utils.modifiers import scale_size_and_price
+
+
+@functools.lru_cache(maxsize=1024)
+def _scale_pure(symbol: str, size: float, price: float, lot_size: float, min_lots: float, tick_size: float, contract_value: float) -> tuple:
+    """Memoised scale_size_and_price; the result depends only on its arguments."""
+    return scale_size_and_price(symbol, size, price, lot_size, min_lots, tick_size, contract_value)
+
+
+class ScalingMixin:
+    """Scale order size and price to an exchange's lot, tick and minimum size rules.
+
+    Requires the host class to provide `async get_symbol_details(symbol)`
+    returning (lot_size, min_lots, tick_size, contract_value).
+    """
+
+    async def scale_size_and_price(self, symbol: str, size: float, price: float) -> tuple:
+        """Return (size_in_lots, price, lot_size) for the symbol."""
+        lot_size, min_lots, tick_size, contract_value = await self.get_symbol_details(symbol)
+        return _scale_pure(symbol, size, price, lot_size, min_lots, tick_size, contract_value)
@@ -1,4 +1,5 @@
 import json
+import orjson
 import logging
 import os
 from typing import Dict, List, Set
@@ -7,6 +8,25 @@ import inspect
 
 logger = logging.getLogger(__name__)
 
+
+def index_weight_config(config: List[dict]) -> Dict[str, dict]:
+    """Index the weight config by symbol so per-cycle lookups don't rescan the source lists.
+
+    Returns {symbol: {'weights': {source: weight}, 'tv_weight', 'bt_weight', 'total_weight', 'leverage'}}.
+    """
+    index = {}
+    for symbol_config in config:
+        weights = {s['source']: s['weight'] for s in symbol_config['sources']}
+        index[symbol_config['symbol']] = {
+            'weights': weights,
+            'tv_weight': weights.get('tradingview', 0),
+            'bt_weight': weights.get('bittensor', 0),
+            'total_weight': sum(w for w in weights.values() if w > 0),
+            'leverage': symbol_config.get('leverage', 1),
+        }
+    return index
+
+
 class SignalManager:
     CACHE_FILE = "account_asset_depths.json"
     CONFIG_FILE = "signal_weight_config.json"
@@ -18,6 +38,7 @@ class SignalManager:
         self.account_processors = {}  # {account_name: processor_instance}
         self.account_asset_depths = {}  # {account_name: {asset: depth}}
         self.config = self._load_config()
+        self.weight_index = index_weight_config(self.config)
         self.previous_signals = {}  # Track previous raw signals
         self._temp_depths = {}  # Initialize temp depths
         self._load_cache()
@@ -27,8 +48,8 @@ class SignalManager:
     def _load_config(self) -> dict:
         """Load signal weight configuration."""
         try:
-            with open(self.CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            with open(self.CONFIG_FILE, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             return {}
@@ -83,30 +104,28 @@ class SignalManager:
         """Check for updates and calculate new depths."""
         updates = {}
         new_depths = {}
-        current_signals = {}
+        current_depths_by_source = {}  # {source: {symbol: depth}}, normalized once per fetch
         has_updates = False
         
         # Reload config each time to catch changes
         self.config = self._load_config()
+        self.weight_index = index_weight_config(self.config)
         
         #logger.info("\n=== Signal Source Depths ===")
         # If no accounts provided, use all known account processors
         accounts_to_check = accounts if accounts is not None else self.account_processors.values()
         
         # Track all accounts that exist in either current accounts or cache
-        all_account_names = set(acc.exchange_name for acc in accounts_to_check) | set(self.account_asset_depths.keys())
+        accounts_by_name = {acc.exchange_name: acc for acc in accounts_to_check}
+        all_account_names = set(accounts_by_name) | set(self.account_asset_depths.keys())
         
         # Initialize with current depths instead of zeros
         for account_name in all_account_names:
-            account = next((acc for acc in accounts_to_check if acc.exchange_name == account_name), None)
-            is_enabled = account.enabled if account else False
-            
             # Start with current depths instead of zeros
             new_depths[account_name] = self.account_asset_depths.get(account_name, {}).copy()
             
             # Only initialize missing symbols
-            for symbol_config in self.config:
-                symbol = symbol_config['symbol']
+            for symbol in self.weight_index:
                 if symbol not in new_depths[account_name]:
                     new_depths[account_name][symbol] = 0
         
@@ -121,16 +140,17 @@ class SignalManager:
                 
                 # Make sure signal.leverage is set for all signals according to self.config
                 source_has_updates = False
-                for symbol_config in self.config:
-                    symbol = symbol_config['symbol']
-                    leverage = symbol_config['leverage']
+                source_depths = {}
+                for symbol, symbol_weights in self.weight_index.items():
+                    leverage = symbol_weights['leverage']
                     
                     # Only process symbols we care about from config
-                    if symbol in signals:
-                        signals[symbol]['leverage'] = leverage
+                    curr_signal = signals.get(symbol)
+                    if isinstance(curr_signal, dict):
+                        curr_signal['leverage'] = leverage
+                        source_depths[symbol] = float(curr_signal.get('depth', 0))
                         
                         # Compare only relevant fields for this symbol
-                        curr_signal = signals.get(symbol, {})
                         prev_signal = prev_signals.get(symbol, {})
                         
                         # Only consider it an update if depth or timestamp changed
@@ -139,33 +159,26 @@ class SignalManager:
                             source_has_updates = True
                             updates[source] = True
                 
-                current_signals[source] = signals
+                current_depths_by_source[source] = source_depths
                 self.previous_signals[source] = signals
             else:
-                logger.info(f"Source {source} is disabled, using zero depths")
-                current_signals[source] = {}
+                logger.info("Source %s is disabled, using zero depths", source)
+                current_depths_by_source[source] = {}
         
         #logger.info("\n=== Weighted Asset Depths ===")
         # Calculate weighted depths for each asset
         asset_depths = {}  # {asset: weighted_depth}
-        for symbol_config in self.config:
-            symbol = symbol_config['symbol']
-            total_weight = 0
+        for symbol, symbol_weights in self.weight_index.items():
+            total_weight = symbol_weights['total_weight']
             weighted_sum = 0
             
             #logger.info(f"\n{symbol} weights:")
-            for source_config in symbol_config['sources']:
-                source = source_config['source']
-                weight = source_config['weight']
-                
+            for source, weight in symbol_weights['weights'].items():
                 if weight > 0:
-                    signals = current_signals.get(source, {})
-                    depth = float(signals.get(symbol, {}).get('depth', 0)) \
-                        if isinstance(signals.get(symbol), dict) else 0
+                    depth = current_depths_by_source.get(source, {}).get(symbol, 0.0)
                     # weight (e.g. 0.30) defines max account allocation of entire account value
                     # depth (e.g. 0.0235) defines what portion of that allocation to use
                     weighted_sum += depth * weight
-                    total_weight += weight
                     #logger.info(f"  {source}: depth={depth}, weight={weight}")
             
             if total_weight > 0:
@@ -178,7 +191,7 @@ class SignalManager:
         # Check each account for changes
         #has_updates = False
         for account_name in all_account_names:
-            account = next((acc for acc in accounts_to_check if acc.exchange_name == account_name), None)
+            account = accounts_by_name.get(account_name)
             is_enabled = account.enabled if account else False
             current_depths = self.account_asset_depths.get(account_name, {})
             
@@ -191,18 +204,16 @@ class SignalManager:
                 target_depth = float(target_depth)
                 
                 if current_depth != target_depth:
-                    logger.info(f"Depth change detected for {account_name} on {asset}: current={current_depth}, target={target_depth}")
+                    logger.info("Depth change detected for %s on %s: current=%s, target=%s", account_name, asset, current_depth, target_depth)
                     has_updates = True
                     new_depths[account_name][asset] = target_depth
                     # Mark all sources for this asset as needing updates
-                    for source_config in next(
-                        sc['sources'] for sc in self.config if sc['symbol'] == asset
-                    ):
-                        updates[source_config['source']] = True
+                    for source in self.weight_index[asset]['weights']:
+                        updates[source] = True
         
         if has_updates:
             self._temp_depths = new_depths
-            logger.info(f"Updates needed: {new_depths}")
+            logger.info("Updates needed: %s", new_depths)
         else:
             self._temp_depths = self.account_asset_depths  # Use current depths if no updates
             #logger.info("No depth changes detected")
@@ -215,4 +226,4 @@ class SignalManager:
             if account_name in self._temp_depths:
                 self.account_asset_depths[account_name] = self._temp_depths[account_name]
                 self._save_cache()
-                logger.info(f"Updated cache for {account_name}") 
\ No newline at end of file
+                logger.info("Updated cache for %s", account_name) 
\ No newline at end of file
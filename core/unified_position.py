@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnifiedPosition:
     symbol: str  # Trading pair (e.g., BTC-USDT)
     size: float  # Size of the open position
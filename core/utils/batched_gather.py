@@ -0,0 +1,16 @@
+import asyncio
+
+EXCHANGE_CONCURRENCY = 5  # in-flight symbol pipelines allowed per exchange
+
+
+async def _bounded(coro, semaphore: asyncio.Semaphore):
+    async with semaphore:
+        return await coro
+
+
+async def batched_gather(coros, semaphore: asyncio.Semaphore, return_exceptions: bool = False) -> list:
+    """Gather coroutines while letting at most the semaphore's limit run at once."""
+    return await asyncio.gather(
+        *(_bounded(coro, semaphore) for coro in coros),
+        return_exceptions=return_exceptions
+    )
@@ -0,0 +1,9 @@
+import itertools
+import time
+
+_oid_counter = itertools.count()  # distinguishes ids generated within the same microsecond
+
+
+def generate_client_oid() -> str:
+    """Return a unique client order id: epoch microseconds followed by a 4-digit hex counter."""
+    return f"{time.time_ns() // 1000}{next(_oid_counter) & 0xFFFF:04x}"
@@ -0,0 +1,30 @@
+import asyncio
+import aiohttp
+import ujson
+
+DNS_CACHE_TTL = 300      # seconds to reuse resolved addresses (aiohttp defaults to 10)
+CONNECTION_LIMIT = 20    # simultaneous connections across all hosts; the pool is process-wide, not per processor
+
+# Shared across calls so keep-alive connections (and their TLS sessions) are reused
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_client_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp session, creating it on first use in the running loop."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(ttl_dns_cache=DNS_CACHE_TTL, limit=CONNECTION_LIMIT)
+        _session = aiohttp.ClientSession(connector=connector, json_serialize=ujson.dumps)
+        _session_loop = loop
+    return _session
+
+
+async def close_client_session():
+    """Close the shared session; the next get_client_session() opens a fresh one."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
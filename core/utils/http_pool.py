@@ -0,0 +1,47 @@
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+# Exchange SDKs sign and send their own requests through `requests`, so connection reuse
+# is done by widening their sessions' keep-alive pools rather than swapping the transport
+POOL_CONNECTIONS = 20  # number of hosts to keep connection pools for
+POOL_MAXSIZE = 50      # keep-alive connections kept per host
+
+
+def _orjson_response(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Response hook that makes `response.json()` decode with orjson."""
+    def json(**_):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Keep raising what requests would, so SDK error handling still applies
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    response.json = json
+    return response
+
+
+def pooled_session(session: requests.Session = None) -> requests.Session:
+    """Mount a keep-alive connection pool on a requests session, creating one if needed."""
+    session = session or requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # SDKs decode every reply with response.json(); swap in the faster parser
+    session.hooks["response"].append(_orjson_response)
+    return session
+
+
+class SessionRequests:
+    """Stand-in for the `requests` module that sends SDK calls through a shared session.
+
+    Some SDKs call `requests.get` / `requests.post` directly, which opens a new
+    connection (and TLS handshake) for every request.
+    """
+    exceptions = requests.exceptions
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+        self.get = session.get
+        self.post = session.post
+        self.request = session.request
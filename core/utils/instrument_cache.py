@@ -0,0 +1,76 @@
+import logging
+import os
+import threading
+import time
+import ujson
+
+INSTRUMENT_CACHE_DIR = "instrument_cache"
+INSTRUMENT_CACHE_TTL = 86400  # seconds a symbol's saved details stay valid across restarts
+
+logger = logging.getLogger(__name__)
+
+# Serializes the read-merge-write in store_instrument_cache when called from worker threads
+_store_lock = threading.Lock()
+
+
+def _cache_path(exchange: str) -> str:
+    return os.path.join(INSTRUMENT_CACHE_DIR, f"instruments_{exchange}.json")
+
+
+def _read_entries(exchange: str) -> dict:
+    """Return the file's unexpired {symbol: [fetched_at, details]} entries."""
+    try:
+        with open(_cache_path(exchange), 'r', encoding='utf-8') as f:
+            payload = ujson.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    ttl = payload.get("ttl", INSTRUMENT_CACHE_TTL)
+    file_ts = payload.get("ts", 0)  # files written before per-symbol timestamps share one
+    now = time.time()
+    entries = {}
+    for symbol, entry in payload.get("data", {}).items():
+        if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[1], list):
+            fetched_at, details = entry
+        else:
+            fetched_at, details = file_ts, entry
+        # Each symbol expires on its own, so rewriting the file never extends an older entry
+        if now - fetched_at <= ttl:
+            entries[symbol] = [fetched_at, details]
+    return entries
+
+
+def load_instrument_cache(exchange: str) -> dict | None:
+    """Return {symbol: (lot_size, min_size, tick_size, contract_value)} saved for an exchange, or None if nothing is still valid."""
+    entries = _read_entries(exchange)
+    if not entries:
+        return None
+    return {symbol: tuple(details) for symbol, (_, details) in entries.items()}
+
+
+def store_instrument_cache(exchange: str, data: dict, replace: bool = False):
+    """Save freshly fetched symbol details for an exchange using an atomic replace.
+
+    Only the symbols in `data` get a new timestamp; other unexpired entries keep theirs.
+    With `replace`, `data` is a full refresh and entries missing from it are dropped.
+    """
+    final_path = _cache_path(exchange)
+    temp_path = f"{final_path}.tmp"
+
+    with _store_lock:
+        entries = {} if replace else _read_entries(exchange)
+        now = time.time()
+        for symbol, details in data.items():
+            entries[symbol] = [now, list(details)]
+
+        payload = {"ttl": INSTRUMENT_CACHE_TTL, "data": entries}
+        try:
+            os.makedirs(INSTRUMENT_CACHE_DIR, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                ujson.dump(payload, f)
+
+            # Atomic rename operation
+            os.replace(temp_path, final_path)
+        except OSError as e:
+            # The file only saves a request on the next start, so never fail a lookup over it
+            logger.warning("Error storing instrument cache for %s: %s", exchange, e)
@@ -0,0 +1,23 @@
+import logging
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime once per second instead of once per record.
+
+    The cache is only used with a datefmt, since the default format carries milliseconds.
+    """
+
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        self._cached = (None, None)  # (whole second, formatted time)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_time = self._cached
+        if second != cached_second:
+            cached_time = super().formatTime(record, datefmt)
+            self._cached = (second, cached_time)
+        return cached_time
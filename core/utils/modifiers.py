@@ -1,12 +1,21 @@
+import functools
+import logging
 from decimal import Decimal, ROUND_DOWN
 
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _to_decimal(value) -> Decimal:
+    """Convert through str so the Decimal matches the printed value; tick sizes and contract values repeat, so cache them."""
+    return Decimal(str(value))
+
 def round_to_tick_size(value, tick_size):
     """Round value to the nearest tick size with correct precision handling."""
     if isinstance(value, float):
         value_decimal = Decimal(str(value))
     else:
         value_decimal = value  # Keep as Decimal if already Decimal
-    tick_size_decimal = Decimal(str(tick_size))
+    tick_size_decimal = _to_decimal(tick_size)
     
     # Round down to nearest tick size
     rounded_value = (value_decimal // tick_size_decimal) * tick_size_decimal
@@ -20,7 +29,7 @@ def calculate_lots(size, contract_value):
         size_decimal = size
         
     if isinstance(contract_value, float):
-        contract_value_decimal = Decimal(str(contract_value))
+        contract_value_decimal = _to_decimal(contract_value)
     else:
         contract_value_decimal = contract_value
         
@@ -29,12 +38,12 @@ def calculate_lots(size, contract_value):
 
 def scale_size_and_price(symbol: str, size: float, price: float, lot_size: float, min_lots: float, tick_size: float, contract_value: float):
  
-    print(f"Symbol {symbol} -> Lot Size: {lot_size}, Min Size: {min_lots}, Tick Size: {tick_size}, Contract Value: {contract_value}")
+    logger.debug("Symbol %s -> Lot Size: %s, Min Size: %s, Tick Size: %s, Contract Value: %s", symbol, lot_size, min_lots, tick_size, contract_value)
     
     # Step 3: Round the price to the nearest tick size
-    print(f"Price before: {price}")
+    logger.debug("Price before: %s", price)
     price = round_to_tick_size(price, tick_size)
-    print(f"Price after tick rounding: {price}")
+    logger.debug("Price after tick rounding: %s", price)
     
     # if size is 0, set size_in_lots to 0
     if size == 0:
@@ -43,16 +52,16 @@ def scale_size_and_price(symbol: str, size: float, price: float, lot_size: float
 
     # Calculate lots - keep everything as float until final output
     size_in_lots = float(size / contract_value)
-    print(f"Size in lots: {size_in_lots}")
+    logger.debug("Size in lots: %s", size_in_lots)
 
     # Ensure minimum size
     sign = -1 if size_in_lots < 0 else 1
     size_in_lots = max(abs(size_in_lots), min_lots) * sign
-    print(f"Size after checking min: {size_in_lots}")
+    logger.debug("Size after checking min: %s", size_in_lots)
     
     # Round to lot size precision
     decimal_places = len(str(lot_size).rsplit('.', maxsplit=1)[-1]) if '.' in str(lot_size) else 0
     size_in_lots = float(f"%.{decimal_places}f" % (round(size_in_lots / lot_size) * lot_size))
-    print(f"Size after rounding to lot size: {size_in_lots}")
+    logger.debug("Size after rounding to lot size: %s", size_in_lots)
 
     return size_in_lots, price, lot_size
\ No newline at end of file
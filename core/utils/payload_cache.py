@@ -0,0 +1,52 @@
+import hashlib
+import logging
+import os
+import time
+import orjson
+
+PAYLOAD_CACHE_DIR = "payload_cache"
+PAYLOAD_CACHE_TTL = 60  # seconds a cached API payload is served instead of refetching
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_path(key: str) -> str:
+    digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+    return os.path.join(PAYLOAD_CACHE_DIR, f"{digest}.json")
+
+
+def load_cached_payload(key: str, ttl: float = PAYLOAD_CACHE_TTL):
+    """Return (stored_at, payload) cached under a key (e.g. an endpoint URL), or None if missing or expired."""
+    path = _cache_path(key)
+    try:
+        with open(path, 'rb') as f:
+            payload = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    ts = payload.get("ts", 0)
+    if time.time() - ts > ttl:
+        # Prune on read so stale payloads don't pile up
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    return ts, payload.get("data")
+
+
+def store_cached_payload(key: str, data):
+    """Cache a payload under a key using an atomic replace."""
+    final_path = _cache_path(key)
+    temp_path = f"{final_path}.tmp"
+
+    try:
+        os.makedirs(PAYLOAD_CACHE_DIR, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(orjson.dumps({"ts": time.time(), "data": data}))
+
+        # Atomic rename operation
+        os.replace(temp_path, final_path)
+    except OSError as e:
+        # A missed cache write only costs a refetch next time
+        logger.warning("Error storing payload cache for %s: %s", key, e)
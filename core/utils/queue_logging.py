@@ -0,0 +1,17 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def enable_queue_logging(logger: logging.Logger = None) -> QueueListener:
+    """Move a logger's handlers behind a queue so logging calls never block on I/O."""
+    logger = logger or logging.getLogger()
+    log_queue = queue.SimpleQueue()
+
+    # The listener thread does the formatting and writing with the original handlers
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
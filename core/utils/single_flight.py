@@ -0,0 +1,26 @@
+import asyncio
+
+# {(exchange, op, symbol): task shared by every caller waiting on that request}
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+def _finish(key: tuple, task: asyncio.Task):
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # mark as retrieved in case every caller gave up waiting
+
+
+async def single_flight(key: tuple, func, *args, **kwargs):
+    """Await `func(*args, **kwargs)` once for all concurrent callers using the same key.
+
+    The first caller starts the request as its own task; callers arriving while
+    it is still running wait on that task instead of issuing a duplicate request.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.get_running_loop().create_task(func(*args, **kwargs))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _finish(key, t))
+    # Shield so a cancelled caller, the first one included, does not cancel the shared request
+    return await asyncio.shield(task)
@@ -0,0 +1,81 @@
+import asyncio
+
+MAX_WAIT_MS = 20  # how long to collect symbol requests before issuing the bulk call
+MAX_BATCH = 50    # distinct symbols that trigger an early flush
+
+
+class SymbolBatcher:
+    """Serve per-symbol lookups from one bulk request per batching window.
+
+    `fetch_all` is an async callable returning rows for every symbol (e.g. all
+    tickers or all open positions) and `key` maps a row to its symbol. Callers
+    awaiting `fetch(symbol)` within the same window get that symbol's rows.
+    """
+
+    def __init__(self, fetch_all, key, max_wait_ms: float = MAX_WAIT_MS, max_batch: int = MAX_BATCH):
+        self.fetch_all = fetch_all
+        self.key = key
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._full = None
+        self._task = None
+
+    async def fetch(self, symbol: str) -> list:
+        """Queue a symbol for the next bulk call and return its rows."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(symbol, []).append(future)
+
+        if self._task is None:
+            self._full = asyncio.Event()
+            self._task = loop.create_task(self._flush(self._full))
+            self._task.add_done_callback(self._abandon_window)
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+
+        return await future
+
+    def _abandon_window(self, task: asyncio.Task):
+        """Cancel the window's callers if its flush task ended before taking them."""
+        if self._task is not task:
+            return
+        pending, self._pending = self._pending, {}
+        self._task = None
+        for futures in pending.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+    async def _flush(self, full: asyncio.Event):
+        try:
+            await asyncio.wait_for(full.wait(), self.max_wait)
+        except asyncio.TimeoutError:
+            pass
+
+        # Requests arriving from here on start a new window
+        pending, self._pending = self._pending, {}
+        self._task = None
+
+        try:
+            rows = await self.fetch_all()
+            by_symbol = {}
+            for row in rows or []:
+                by_symbol.setdefault(self.key(row), []).append(row)
+
+            for symbol, futures in pending.items():
+                result = by_symbol.get(symbol, [])
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            # Cancelled or hit a BaseException: cancel what is left so no caller hangs
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
@@ -0,0 +1,35 @@
+import time
+
+SYMBOL_TTL = 300.0  # seconds before instrument details are fetched again
+
+# {(exchange, symbol): (fetched_at, (lot_size, min_size, tick_size, contract_value))}
+_symbol_cache: dict[tuple[str, str], tuple[float, tuple]] = {}
+
+
+def get_cached_symbol_details(exchange: str, symbol: str):
+    """Return cached symbol details if they are still fresh, otherwise None."""
+    entry = _symbol_cache.get((exchange, symbol))
+    if entry is None:
+        return None
+
+    fetched_at, details = entry
+    if time.monotonic() - fetched_at < SYMBOL_TTL:
+        return details
+    return None
+
+
+def cache_symbol_details(exchange: str, symbol: str, details: tuple) -> tuple:
+    """Store symbol details for an exchange and return them."""
+    _symbol_cache[(exchange, symbol)] = (time.monotonic(), details)
+    return details
+
+
+def clear_symbol_cache(exchange: str = None, symbol: str = None):
+    """Drop cached symbol details, optionally limited to an exchange and/or symbol."""
+    for key in list(_symbol_cache):
+        cached_exchange, cached_symbol = key
+        if exchange is not None and cached_exchange != exchange:
+            continue
+        if symbol is not None and cached_symbol != symbol:
+            continue
+        del _symbol_cache[key]
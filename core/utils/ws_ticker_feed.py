@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+import aiohttp
+from core.utils.client_session import get_client_session
+
+logger = logging.getLogger(__name__)
+
+STALE_AFTER = 10.0     # seconds without an update before a streamed ticker is ignored
+PING_INTERVAL = 15.0   # seconds between keepalive messages
+RECONNECT_DELAY = 2.0  # seconds to wait before reconnecting a dropped stream
+
+
+class WSTickerFeed:
+    """Keep the latest ticker per symbol from an exchange WebSocket stream.
+
+    `subscribe_message(symbol)` builds the text frame that subscribes a symbol,
+    and `parse_frame(raw)` turns an incoming text frame into a UnifiedTicker
+    (or None for acks, pongs and other channels).
+    """
+
+    def __init__(self, url: str, subscribe_message, parse_frame, ping_message: str = None,
+                 ping_interval: float = PING_INTERVAL, stale_after: float = STALE_AFTER):
+        self.url = url
+        self.subscribe_message = subscribe_message
+        self.parse_frame = parse_frame
+        self.ping_message = ping_message
+        self.ping_interval = ping_interval
+        self.stale_after = stale_after
+
+        # {symbol: (received_at, UnifiedTicker)}
+        self._latest_ticker: dict[str, tuple] = {}
+        self._symbols: set[str] = set()
+        self._ws = None
+        self._task = None
+
+    def get(self, symbol: str):
+        """Return the streamed ticker for a symbol, or None if it is missing or stale."""
+        entry = self._latest_ticker.get(symbol)
+        if entry is None or time.monotonic() - entry[0] > self.stale_after:
+            return None
+        return entry[1]
+
+    async def subscribe(self, symbol: str):
+        """Start streaming a symbol, opening the connection on first use."""
+        if self._task is None or self._task.done():
+            self._symbols.add(symbol)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        elif symbol not in self._symbols:
+            self._symbols.add(symbol)
+            if self._ws is not None and not self._ws.closed:
+                await self._ws.send_str(self.subscribe_message(symbol))
+
+    async def close(self):
+        """Stop the stream and forget every subscription."""
+        self._symbols.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while self._symbols:
+            try:
+                # Reconnects reuse the shared pool instead of opening a session per attempt
+                session = await get_client_session()
+                async with session.ws_connect(self.url) as ws:
+                    self._ws = ws
+                    for symbol in list(self._symbols):
+                        await ws.send_str(self.subscribe_message(symbol))
+
+                    keepalive = asyncio.create_task(self._keepalive(ws))
+                    try:
+                        async for msg in ws:
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                try:
+                                    ticker = self.parse_frame(msg.data)
+                                except Exception as e:
+                                    # One malformed frame shouldn't drop the whole stream
+                                    logger.debug("Error parsing ticker frame from %s: %s", self.url, e)
+                                    continue
+                                if ticker is not None:
+                                    self._latest_ticker[ticker.symbol] = (time.monotonic(), ticker)
+                            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                break
+                    finally:
+                        keepalive.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Error in ticker stream %s: %s", self.url, e)
+            finally:
+                self._ws = None
+
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _keepalive(self, ws):
+        if self.ping_message is None:
+            return
+        try:
+            while not ws.closed:
+                await asyncio.sleep(self.ping_interval)
+                await ws.send_str(self.ping_message)
+        except Exception:
+            # The reader loop notices the dropped connection and reconnects
+            return
@@ -1,10 +1,11 @@
-import json
-import time
+import orjson
 from typing import Dict, List, Tuple
 import logging
 from datetime import datetime
 from collections import defaultdict
 import asyncio
+from signal import SIGINT, SIGTERM
+from concurrent.futures import ThreadPoolExecutor
 
 from signal_processors.tradingview_processor import TradingViewProcessor
 from signal_processors.bittensor_processor import BittensorProcessor
@@ -12,28 +13,36 @@ from account_processors.bybit_processor import ByBit
 from account_processors.blofin_processor import BloFin
 from account_processors.kucoin_processor import KuCoin
 from account_processors.mexc_processor import MEXC
-from core.signal_manager import SignalManager
+from core.signal_manager import SignalManager, index_weight_config
+from core.utils.queue_logging import enable_queue_logging
+from core.utils.log_formatter import CachedTimeFormatter
+from core.utils.batched_gather import batched_gather, EXCHANGE_CONCURRENCY
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(CachedTimeFormatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %I:%M:%S %p'
-)
+))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
+enable_queue_logging()  # handlers write from a background thread, off the trading loop
 logger = logging.getLogger(__name__)
 
 class TradeExecutor:
     sleep_time = 0.5
+    sdk_thread_workers = 32  # threads available to blocking exchange SDK calls
     
     def _load_weight_config(self) -> bool:
         """Load signal weight configuration from file. Returns True if successful."""
         try:
-            with open('signal_weight_config.json', 'r') as f:
-                self.weight_config = json.load(f)
+            with open('signal_weight_config.json', 'rb') as f:
+                self.weight_config = orjson.loads(f.read())
+            self.weight_index = index_weight_config(self.weight_config)
+            self.configured_symbols = frozenset(self.weight_index)
             return True
         except FileNotFoundError:
             logger.error("signal_weight_config.json not found")
             return False
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("signal_weight_config.json is malformed")
             return False
 
@@ -47,14 +56,10 @@ class TradeExecutor:
 
         # Initialize processors with enabled state based on non-zero weights
         self.bittensor_processor = BittensorProcessor(
-            enabled=any(any(s['weight'] > 0 for s in symbol['sources'] 
-                          if s['source'] == 'bittensor') 
-                       for symbol in self.weight_config)
+            enabled=any(cfg['bt_weight'] > 0 for cfg in self.weight_index.values())
         )
         self.tradingview_processor = TradingViewProcessor(
-            enabled=any(any(s['weight'] > 0 for s in symbol['sources'] 
-                          if s['source'] == 'tradingview') 
-                       for symbol in self.weight_config)
+            enabled=any(cfg['tv_weight'] > 0 for cfg in self.weight_index.values())
         )
         
         # Initialize exchange accounts
@@ -64,13 +69,36 @@ class TradeExecutor:
             KuCoin(),
             MEXC()
         ]
+        self._mapped_symbols = None
+        self._map_account_symbols()
+        
+        # Per-exchange caps on concurrent symbol pipelines, created on the running loop
+        self._exchange_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _map_account_symbols(self):
+        """Cache each account's exchange symbol for every configured signal symbol."""
+        # The config is reloaded every cycle but its symbol set rarely changes
+        if self.configured_symbols == self._mapped_symbols:
+            return
+        self._mapped_symbols = self.configured_symbols
+        for account in self.accounts:
+            account._symbol_map = {
+                signal_symbol: account.map_signal_symbol_to_exchange(signal_symbol)
+                for signal_symbol in self.configured_symbols
+            }
+
+    def _exchange_semaphore(self, account) -> asyncio.Semaphore:
+        """Return the semaphore that limits concurrent requests to an account's exchange."""
+        if account.exchange_name not in self._exchange_semaphores:
+            self._exchange_semaphores[account.exchange_name] = asyncio.Semaphore(EXCHANGE_CONCURRENCY)
+        return self._exchange_semaphores[account.exchange_name]
         
     async def get_signals(self) -> Dict:
         """Fetch and combine signals from all sources."""
         try:
             # Check for updates in signal sources
             updates = self.signal_manager.check_for_updates(self.accounts)
-            logger.info(f"Checking for updates: {updates}")
+            logger.info("Checking for updates: %s", updates)
             
             # Get the new depths that need to be applied
             if hasattr(self.signal_manager, '_temp_depths'):
@@ -86,44 +114,46 @@ class TradeExecutor:
     async def process_account(self, account, signals: Dict):
         """Process signals for a specific account."""
         try:
-            # Update weight configg by calling the _load_weight_config
-            self._load_weight_config()
-            
             # Skip disabled accounts but still process with zero depths
             if not account.enabled:
-                logger.info(f"Skipping disabled account: {account.exchange_name}")
+                logger.info("Skipping disabled account: %s", account.exchange_name)
                 # Process all symbols with zero depth
-                for symbol_config in self.weight_config:
-                    signal_symbol = symbol_config['symbol']
-                    exchange_symbol = account.map_signal_symbol_to_exchange(signal_symbol)
-                    await account.reconcile_position(
-                        symbol=exchange_symbol,
-                        size=0,
-                        leverage=symbol_config.get('leverage', 1),
-                        margin_mode="isolated"
-                    )
+                await batched_gather(
+                    (
+                        account.reconcile_position(
+                            symbol=account._symbol_map[signal_symbol],
+                            size=0,
+                            leverage=cfg['leverage'],
+                            margin_mode="isolated"
+                        )
+                        for signal_symbol, cfg in self.weight_index.items()
+                    ),
+                    self._exchange_semaphore(account)
+                )
                 return True, None
                 
             # Get total account value (including positions)
             total_value = await account.fetch_initial_account_value()
             if not total_value:
-                logger.warning(f"No account value found for {account.exchange_name}")
+                logger.warning("No account value found for %s", account.exchange_name)
                 return False, "No account value found"
 
-            logger.info(f"Processing {account.exchange_name} with total value: {total_value}")
+            logger.info("Processing %s with total value: %s", account.exchange_name, total_value)
 
-            for symbol_config in self.weight_config:
-                signal_symbol = symbol_config['symbol']
+            async def _handle_symbol(signal_symbol, cfg):
                 depth = signals.get(account.exchange_name, {}).get(signal_symbol, 0)  # Get account-specific depth
                 
                 # Map to exchange symbol format
-                exchange_symbol = account.map_signal_symbol_to_exchange(signal_symbol)
+                exchange_symbol = account._symbol_map[signal_symbol]
                 
-                # Get current market price
-                ticker = await account.fetch_tickers(exchange_symbol)
+                # Current market price and precision/lot requirements are independent lookups
+                ticker, symbol_details = await asyncio.gather(
+                    account.fetch_tickers(exchange_symbol),
+                    account.get_symbol_details(exchange_symbol)
+                )
                 if not ticker:
-                    logger.error(f"Could not get price for {exchange_symbol}")
-                    continue
+                    logger.error("Could not get price for %s", exchange_symbol)
+                    return
 
                 price = ticker.last  # Use last price from ticker
 
@@ -131,28 +161,30 @@ class TradeExecutor:
                 position_value = total_value * depth  # depth is already weighted (0.0145)
 
                 # Calculate raw quantity based on leverage
-                leverage = symbol_config.get('leverage', 1)
+                leverage = cfg['leverage']
                 notional_value = position_value * leverage  # Total position value including leverage
                 quantity = notional_value / price  # Convert to asset quantity
 
                 if depth < 0:
                     quantity = -quantity
 
-                logger.info(f"Account Value: {total_value}, Depth: {depth}, "
-                           f"Position Value: {position_value}, Leverage: {leverage}, "
-                           f"Notional Value: {notional_value}, Quantity: {quantity}")
+                logger.info("Account Value: %s, Depth: %s, "
+                           "Position Value: %s, Leverage: %s, "
+                           "Notional Value: %s, Quantity: %s",
+                           total_value, depth, position_value, leverage, notional_value, quantity)
 
-                # Get symbol details to log the precision/lot requirements
-                symbol_details = await account.get_symbol_details(exchange_symbol)
+                # Log the precision/lot requirements
                 lot_size, min_size, tick_size, contract_value = symbol_details  # Unpack the tuple
                 
-                logger.info(f"{exchange_symbol}: depth={depth}, "
-                          f"position_value={position_value}, raw_quantity={quantity}")
-                logger.info(f"Symbol {exchange_symbol} -> "
-                          f"Lot Size: {lot_size}, "
-                          f"Min Size: {min_size}, "
-                          f"Tick Size: {tick_size}, "
-                          f"Contract Value: {contract_value}")
+                logger.info("%s: depth=%s, "
+                          "position_value=%s, raw_quantity=%s",
+                          exchange_symbol, depth, position_value, quantity)
+                logger.info("Symbol %s -> "
+                          "Lot Size: %s, "
+                          "Min Size: %s, "
+                          "Tick Size: %s, "
+                          "Contract Value: %s",
+                          exchange_symbol, lot_size, min_size, tick_size, contract_value)
 
                 # Let reconcile_position handle the quantity precision
                 await account.reconcile_position(
@@ -162,6 +194,23 @@ class TradeExecutor:
                     margin_mode="isolated"
                 )
 
+            # Symbols reconcile independently, so run them side by side within the exchange's limit
+            results = await batched_gather(
+                (_handle_symbol(signal_symbol, cfg) for signal_symbol, cfg in self.weight_index.items()),
+                self._exchange_semaphore(account),
+                return_exceptions=True
+            )
+            errors = [
+                f"Error processing {signal_symbol} on {account.exchange_name}: {str(result)}"
+                for signal_symbol, result in zip(self.weight_index, results)
+                if isinstance(result, Exception)
+            ]
+            if errors:
+                # Leave the cycle unconfirmed so failed symbols are retried
+                for error_msg in errors:
+                    logger.error(error_msg)
+                return False, "; ".join(errors)
+
             return True, None
 
         except Exception as e:
@@ -169,6 +218,15 @@ class TradeExecutor:
             logger.error(error_msg)
             return False, error_msg
 
+    async def aclose(self):
+        """Release the network resources held by the processors; call once at program exit."""
+        # Streams first: they run on the shared session the Bittensor processor closes
+        await asyncio.gather(
+            *(account.aclose() for account in self.accounts if hasattr(account, "aclose")),
+            return_exceptions=True
+        )
+        await self.bittensor_processor.aclose()
+
     async def execute(self):
         """Execute trades based on signal changes."""
         try:
@@ -182,16 +240,15 @@ class TradeExecutor:
             # Get signals that need to be executed
             signals = self.signal_manager._temp_depths
             
-            # Process all accounts concurrently
-            tasks: List[asyncio.Task] = []
-            for account in self.accounts:
-                task = asyncio.create_task(
-                    self.process_account(account, signals)
-                )
-                tasks.append(task)
+            # Refresh the weight config once per cycle so every account trades against the same snapshot
+            self._load_weight_config()
+            self._map_account_symbols()
             
-            # Wait for all account processing to complete
-            results: List[Tuple[bool, str]] = await asyncio.gather(*tasks, return_exceptions=True)
+            # Process all accounts concurrently; return_exceptions keeps one exchange's failure from cancelling the rest
+            results: List[Tuple[bool, str]] = await asyncio.gather(
+                *(self.process_account(account, signals) for account in self.accounts),
+                return_exceptions=True
+            )
             
             # Process results and confirm executions
             all_successful = True
@@ -217,11 +274,9 @@ class TradeExecutor:
 async def calculate_trade_amounts(accounts, signals):
     """Calculate trade amounts based on account values and signal weights."""
     try:
-        # Get total account values using new methods
-        account_values = {}
-        for account in accounts:
-            total_value = await account.fetch_initial_account_value()
-            account_values[account.exchange_name] = total_value
+        # Get total account values using new methods; each exchange is queried concurrently
+        values = await asyncio.gather(*(account.fetch_initial_account_value() for account in accounts))
+        account_values = {account.exchange_name: value for account, value in zip(accounts, values)}
             
         print("\nAccount Values:")
         for exchange, value in account_values.items():
@@ -229,7 +284,7 @@ async def calculate_trade_amounts(accounts, signals):
             
         # Calculate aggregate depths and leverages by asset
         asset_depths = defaultdict(float)
-        asset_leverages = defaultdict(list)
+        asset_leverages = defaultdict(set)
         
         for signal in signals:
             symbol = signal.symbol
@@ -238,15 +293,14 @@ async def calculate_trade_amounts(accounts, signals):
             leverage = signal.leverage
             
             asset_depths[base_asset] += depth
-            if leverage not in asset_leverages[base_asset]:
-                asset_leverages[base_asset].append(leverage)
+            asset_leverages[base_asset].add(leverage)
                 
         # Print summary of depths and leverages
         print("\nExpected Position Summary:")
         for asset, depth in asset_depths.items():
             print(f"\n{asset}:")
             print(f"  Total Depth: {depth:.1f}%")
-            print(f"  Leverage(s): {asset_leverages[asset]}")
+            print(f"  Leverage(s): {sorted(asset_leverages[asset])}")
 
         # Calculate trade amounts for each account and signal
         trade_amounts = {}
@@ -281,24 +335,26 @@ async def execute_trades(accounts, signals):
             for symbol, amount in amounts.items():
                 print(f"  {symbol}: {amount:.2f} USDT")
         
-        # Execute trades for each account
-        for account in accounts:
-            exchange_amounts = trade_amounts[account.exchange_name]
-            
-            for signal in signals:
-                amount = exchange_amounts[signal.symbol]
-                
-                try:
-                    # Reconcile position with calculated amount
-                    await account.reconcile_position(
-                        symbol=signal.symbol,
-                        size=signal.size,
-                        leverage=signal.leverage,
-                        margin_mode=signal.margin_mode
-                    )
-                except Exception as e:
-                    print(f"Error executing trade on {account.exchange_name} for {signal.symbol}: {str(e)}")
-                    continue
+        async def _reconcile(account, signal):
+            try:
+                # Reconcile position with calculated amount
+                await account.reconcile_position(
+                    symbol=signal.symbol,
+                    size=signal.size,
+                    leverage=signal.leverage,
+                    margin_mode=signal.margin_mode
+                )
+            except Exception as e:
+                print(f"Error executing trade on {account.exchange_name} for {signal.symbol}: {str(e)}")
+        
+        # Execute trades for every account concurrently, capping in-flight reconciliations per exchange
+        await asyncio.gather(*(
+            batched_gather(
+                (_reconcile(account, signal) for signal in signals),
+                asyncio.Semaphore(EXCHANGE_CONCURRENCY)
+            )
+            for account in accounts
+        ))
                     
         return True
         
@@ -308,18 +364,42 @@ async def execute_trades(accounts, signals):
 
 async def main():
     executor = TradeExecutor()
-    logger.info(f"Starting execution cycle at {datetime.now()}")
-    while True:
+    
+    # Exchange SDKs are blocking and run via asyncio.to_thread; size the pool so every account can overlap
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=executor.sdk_thread_workers)
+    )
+    # Stop between cycles on SIGINT/SIGTERM rather than being killed mid-reconcile
+    stop = asyncio.Event()
+    for sig in (SIGINT, SIGTERM):
         try:
-            # Execute trades
-            await executor.execute()
-            logger.info("Execution complete, waiting for next cycle...")
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass  # no loop signal handlers on Windows; Ctrl+C still raises KeyboardInterrupt
+    
+    logger.info(f"Starting execution cycle at {datetime.now()}")
+    try:
+        while not stop.is_set():
+            delay = executor.sleep_time
+            try:
+                # Execute trades
+                await executor.execute()
+                logger.info("Execution complete, waiting for next cycle...")
+                
+            except Exception as e:
+                logger.error(f"Error in main loop: {str(e)}")
+                delay = 5
             
-        except Exception as e:
-            logger.error(f"Error in main loop: {str(e)}")
-            time.sleep(5)
+            # Wait out the delay without blocking the loop, waking early on shutdown
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
         
-        time.sleep(executor.sleep_time)
+        logger.info("Shutdown requested, exiting")
+    finally:
+        # Close the shared aiohttp session before the loop goes away
+        await executor.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
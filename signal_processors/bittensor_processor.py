@@ -1,12 +1,22 @@
 import asyncio
-import aiohttp
+import functools
+import heapq
+import itertools
+import operator
 import ujson
+import orjson
 import os
+import sys
+import time
 from datetime import datetime, timedelta
 from config.credentials import load_bittensor_credentials
+from core.utils.client_session import get_client_session, close_client_session
+from core.utils.payload_cache import load_cached_payload, store_cached_payload
+from core.utils.log_formatter import CachedTimeFormatter
+from core.bittensor_signals import BTTSN8MinerStats
 import zipfile
 import numpy as np
-from math import sqrt
+from math import log1p, sqrt
 import logging
 import ujson as json
 
@@ -14,17 +24,40 @@ import ujson as json
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 if not logger.handlers:
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', '%Y-%m-%d %I:%M:%S %p')
+    formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s', '%Y-%m-%d %I:%M:%S %p')
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+# Canonical order_type tag; raw values are normalized once per distinct string by _order_type_tag
+_FLAT = sys.intern("FLAT")
+
+
+@functools.lru_cache(maxsize=None)
+def _order_type_tag(order_type):
+    """Return the interned, upper-cased and stripped form of a raw order_type."""
+    return sys.intern(order_type.upper().strip())
+
+
+# Prebuilt field accessors for the order replay and the batched per-miner scores
+_processed_ms = operator.itemgetter("processed_ms")
+_open_ms = operator.itemgetter("open_ms")
+_close_ms = operator.itemgetter("close_ms")
+_leverage_and_price = operator.itemgetter("leverage", "price")
+
 class BittensorProcessor:
     SIGNAL_SOURCE = "bittensor"
     RAW_SIGNALS_DIR = "raw_signals/bittensor"
     ARCHIVE_DIR = "raw_signals/bittensor/archive"
+    ARCHIVE_COMPRESS_LEVEL = 1  # fastest deflate; repetitive JSON still shrinks well
     SIGNAL_FILE_PREFIX = "bittensor_signal"
     SIGNAL_FREQUENCY = 1  # seconds between signal preparations
+    RAW_SIGNALS_CACHE_TTL = 60  # seconds a fetched miner payload is reused before hitting the API again
+
+    # Last fetched payload as (fetched_at, payload), and the ranking computed for that exact payload
+    # object as (payload, assets, result); instance state, these are only the empty defaults
+    _raw_signals_memo = None
+    _ranking_memo = None
     
     CORE_ASSET_MAPPING = {
         "BTCUSD": "BTCUSDT",
@@ -33,6 +66,9 @@ class BittensorProcessor:
     }
     
     LEVERAGE_LIMIT_CRYPTO = 0.5
+    DRAWDOWN_VECTORIZE_MIN_ORDERS = 160 # below this, the plain loop beats NumPy's per-call overhead
+    CONSISTENCY_VECTORIZE_MIN_POSITIONS = 128  # same trade-off for the trade interval statistics
+    SHARPE_VECTORIZE_MIN_RETURNS = 128  # same trade-off for a single Sharpe ratio
 
     # Filtering thresholds
     MIN_TRADES = 10                    # Minimum number of trades required
@@ -91,7 +127,7 @@ class BittensorProcessor:
         allocations = self._calculate_gradient_allocation(len(ranked_miners))
         if verbose:
             print("\n=== Gradient Allocations ===")
-            for rank, weight in allocations.items():
+            for rank, weight in enumerate(allocations, 1):
                 print(f"Rank {rank}: {weight:.4f}")
 
         # Initialize asset depths
@@ -100,7 +136,7 @@ class BittensorProcessor:
         # Process each ranked miner's positions
         for rank, miner_data in enumerate(ranked_miners, 1):
             miner_hotkey = miner_data['hotkey']
-            miner_weight = allocations[rank]  # Get miner's weight based on rank
+            miner_weight = allocations[rank - 1]  # Get miner's weight based on rank
             miner_positions = positions_data[miner_hotkey]['positions']
 
             if verbose:
@@ -109,7 +145,7 @@ class BittensorProcessor:
             # Group positions by asset
             for position in miner_positions:
                 asset = position['trade_pair'][0]
-                if asset not in assets_to_trade:
+                if asset not in self.CORE_ASSET_MAPPING:  # dict lookup rather than a scan of assets_to_trade
                     continue
 
                 # Calculate net leverage for this position
@@ -117,7 +153,7 @@ class BittensorProcessor:
                 net_pos, avg_price = self._compute_net_position_and_average_price(orders)
                 
                 if net_pos != 0:  # Only include non-zero positions
-                    timestamp = max(order['processed_ms'] for order in orders)
+                    timestamp = max(map(_processed_ms, orders))
                     weighted_leverage = net_pos * miner_weight
                     
                     if verbose:
@@ -238,32 +274,57 @@ class BittensorProcessor:
     async def run_signal_loop(self):
         """Main loop for preparing signals at regular intervals."""
         logger.info("Starting Bittensor signal processor loop")
-        while True:
-            try:
-                logger.info("Preparing signals...")
-                signals = await self.prepare_signals(verbose=True)
-                if signals:
-                    logger.info(f"Successfully prepared signals for {len(signals)} assets")
-                else:
-                    logger.warning("No signals were prepared in this cycle")
-                logger.info(f"Signal preparation complete, waiting {self.SIGNAL_FREQUENCY} seconds for next cycle...")
-                await asyncio.sleep(self.SIGNAL_FREQUENCY)
-            except Exception as e:
-                logger.error(f"Error in signal loop: {e}")
-                logger.info("Retrying in 5 seconds...")
-                await asyncio.sleep(5)  # Short sleep on error before retry
+        try:
+            while True:
+                try:
+                    logger.info("Preparing signals...")
+                    signals = await self.prepare_signals(verbose=True)
+                    if signals:
+                        logger.info(f"Successfully prepared signals for {len(signals)} assets")
+                    else:
+                        logger.warning("No signals were prepared in this cycle")
+                    logger.info(f"Signal preparation complete, waiting {self.SIGNAL_FREQUENCY} seconds for next cycle...")
+                    await asyncio.sleep(self.SIGNAL_FREQUENCY)
+                except Exception as e:
+                    logger.error(f"Error in signal loop: {e}")
+                    logger.info("Retrying in 5 seconds...")
+                    await asyncio.sleep(5)  # Short sleep on error before retry
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        """Release the pooled HTTP connections used for signal fetches."""
+        await close_client_session()
 
     async def _fetch_raw_signals(self):
-        """Fetch raw signals from the API."""
+        """Fetch raw signals from the API, reusing a recent payload if one is cached."""
+        # Within the TTL hand back the same payload object, so its ranking can be reused too
+        memo = self._raw_signals_memo
+        if memo is not None and time.time() - memo[0] <= self.RAW_SIGNALS_CACHE_TTL:
+            return memo[1]
+
+        endpoint = self.credentials.bittensor_sn8.endpoint
+        cached = await asyncio.to_thread(load_cached_payload, endpoint, self.RAW_SIGNALS_CACHE_TTL)
+        if cached is not None:
+            # Keep the parsed payload in memory so later calls skip the disk and share its ranking.
+            # Stamp it with the file's own time so the memo never outlives the payload's TTL
+            self._raw_signals_memo = cached
+            return cached[1]
+
         headers = {'Content-Type': 'application/json'}
         data = {'api_key': self.credentials.bittensor_sn8.api_key}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.credentials.bittensor_sn8.endpoint, json=data, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json(loads=ujson.loads)
-                print(f"Failed to fetch data: {response.status}")
-                return None
+        session = await get_client_session()
+        async with session.get(endpoint, json=data, headers=headers) as response:
+            if response.status == 200:
+                # Decode straight from the body bytes; response.json() would build a full str copy first.
+                # Parsing and caching a multi-MB payload runs in a worker thread to keep the loop free
+                payload = await asyncio.to_thread(orjson.loads, await response.read())
+                await asyncio.to_thread(store_cached_payload, endpoint, payload)
+                self._raw_signals_memo = (time.time(), payload)
+                return payload
+            print(f"Failed to fetch data: {response.status}")
+            return None
 
     def _store_signal_on_disk(self, data):
         """Store raw signal data to disk using atomic operations."""
@@ -281,8 +342,8 @@ class BittensorProcessor:
         final_path = os.path.join(self.RAW_SIGNALS_DIR, filename)
         
         # Write to temporary file first
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            ujson.dump(data, f, indent=4)
+        with open(temp_path, 'wb') as f:
+            f.write(orjson.dumps(data))  # compact; these files are read back by code, not people
             
         # Atomic rename operation
         os.replace(temp_path, final_path)
@@ -293,16 +354,22 @@ class BittensorProcessor:
             return []
 
         # Sort miners by all_time_returns and select the top if specified
-        sorted_miners = sorted(data.items(), key=lambda x: x[1].get('all_time_returns', 0), reverse=True)
+        by_returns = lambda x: x[1].get('all_time_returns', 0)
         if top_miners:
-            sorted_miners = sorted_miners[:top_miners]
+            # Same order as a full sort and slice, without sorting every miner
+            sorted_miners = heapq.nlargest(top_miners, data.items(), key=by_returns)
+        else:
+            sorted_miners = sorted(data.items(), key=by_returns, reverse=True)
 
         # Get allocation for each miner based on rank
         allocations = self._calculate_gradient_allocation(len(sorted_miners))
+        core_asset_mapping = self.CORE_ASSET_MAPPING  # bound once for the per-position lookups below
 
         # Initialize asset tracking dictionaries
-        asset_depths = {}
-        miner_tracker = []  # Track miners that have been processed
+        # Orders are collected per symbol as columns and replayed in time order afterwards (offsets,
+        # flips and FLAT resets), so this stays a plain Python pass rather than a compiled reduction
+        asset_depths = {}  # {symbol: {column: [values], "original_symbols": set}}
+        miner_tracker = set()  # Track miners that have been processed
 
         # Iterate through the ranked miners and apply gradient allocations
         for rank, (miner_hotkey, miner_positions) in enumerate(sorted_miners, start=1):
@@ -312,84 +379,80 @@ class BittensorProcessor:
                 print(f"Skipping miner {miner_hotkey} as it has already been processed.")
                 continue
 
-            miner_tracker.append(miner_hotkey)  # Mark this asset as seen for this miner
+            miner_tracker.add(miner_hotkey)  # Mark this asset as seen for this miner
             #print(f"Processing miner {miner_hotkey} at rank {rank}")
 
-            allocation_weight = allocations[rank]
+            allocation_weight = allocations[rank - 1]
+            depth_scale = allocation_weight / self.LEVERAGE_LIMIT_CRYPTO  # capped leverage -> depth for this miner
 
             for position_data in miner_positions.get('positions', []):
 
-                # iterate all trade pairs and get the original symbol which has a mapping in CORE_ASSET_MAPPING
-                original_symbol = next(
-                    (
-                        trade_pair
-                        for trade_pair in position_data['trade_pair']
-                        if trade_pair in self.CORE_ASSET_MAPPING
-                    ),
-                    None,
-                )
-                if mapped_only and not original_symbol:
+                # iterate all trade pairs and get the first original symbol which has a mapping in CORE_ASSET_MAPPING
+                original_symbol = next(filter(core_asset_mapping.__contains__, position_data['trade_pair']), None)
+                # Normalize the symbol to match core asset format
+                symbol = core_asset_mapping.get(original_symbol)
+                if mapped_only and symbol is None:
                     #print(f"Skipping {original_symbol} as it is not mapped to a core asset.")
                     continue
 
-                # Normalize the symbol to match core asset format
-                symbol = self.CORE_ASSET_MAPPING[original_symbol]
-
                 # add an entry for the symbol with the net from the miner
                 if symbol not in asset_depths:
-                    asset_depths[symbol] = []
+                    asset_depths[symbol] = {
+                        "order_type": [], "leverage": [], "price": [], "processed_ms": [],
+                        "original_symbols": set(), "last_entry_ms": None, "last_price": None,
+                    }
                 
                 # Skip if the position has no net leverage or is closed
                 if position_data["net_leverage"] == 0 or position_data["is_closed_position"]:
                     #print(f"Skipping {symbol} as it has no net leverage.")
                     continue
                
-                net_pos, avg_price = self._compute_net_position_and_average_price(position_data["orders"])
+                orders = position_data["orders"]
+                net_pos, avg_price = self._compute_net_position_and_average_price(orders)
                     
                 capped_leverage = min(net_pos, self.LEVERAGE_LIMIT_CRYPTO)
-                normalized_depth = (capped_leverage / self.LEVERAGE_LIMIT_CRYPTO) * allocation_weight
+                normalized_depth = capped_leverage * depth_scale
                 
-                latest_order_ms = max(order['processed_ms'] for order in position_data['orders'])
+                order_ms = list(map(_processed_ms, orders))
+                latest_order_ms = max(order_ms)
                 latest_order_tstamp = datetime.fromtimestamp(latest_order_ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
                     
                 print(f"Miner {miner_hotkey} in {symbol} with {normalized_depth:.2%} depth of ${avg_price:.2f} at {latest_order_tstamp}")
                 
                 # Add the net position to the total depth
-                for order in position_data["orders"]:                
-                    asset_depths[symbol].append(
-                        {
-                            "order_type": order["order_type"],
-                            "leverage": order["leverage"] * allocation_weight,
-                            "price": order["price"],
-                            "processed_ms": order["processed_ms"],
-                            "original_symbol": original_symbol,
-                        }
-                    )
+                columns = asset_depths[symbol]
+                columns["order_type"].extend(_order_type_tag(order["order_type"]) for order in orders)
+                columns["leverage"].extend(order["leverage"] * allocation_weight for order in orders)
+                columns["price"].extend(order["price"] for order in orders)
+                columns["processed_ms"].extend(order_ms)
+                columns["original_symbols"].add(original_symbol)
+
+                # Keep the symbol's latest order and its price as we go (first one wins on ties)
+                if columns["last_entry_ms"] is None or latest_order_ms > columns["last_entry_ms"]:
+                    columns["last_entry_ms"] = latest_order_ms
+                    columns["last_price"] = orders[order_ms.index(latest_order_ms)]["price"]
 
 
         # Prepare final results with capped depth and weighted average price
         results = []
 
-        for symbol, entries in asset_depths.items():
-            # Re-calculate net position and average price
-            net_pos, avg_price = self._compute_net_position_and_average_price(entries)
-
-            # Get the last entry date for the symbol
-            last_entry_ms = max(entry["processed_ms"] for entry in entries)
-            last_entry_date = datetime.fromtimestamp(last_entry_ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
-
-            # Get the latest recorded price for the symbol using the last entry date
-            last_price = next(
-                (
-                    entry["price"]
-                    for entry in entries
-                    if entry["processed_ms"] == last_entry_ms
-                ),
-                None,
-            )
+        for symbol, columns in asset_depths.items():
+            # Re-calculate net position and average price over the orders in time order
+            if _FLAT in columns["order_type"]:  # tags are already normalized
+                net_pos, avg_price = 0.0, 0.0
+            else:
+                chronological = np.argsort(columns["processed_ms"], kind="stable")  # stable, like sorted()
+                net_pos, avg_price = self._replay_net_position(zip(
+                    np.asarray(columns["leverage"])[chronological].tolist(),
+                    np.asarray(columns["price"])[chronological].tolist(),
+                ))
+
+            # The last entry and its price were tracked while the orders were collected
+            last_entry_date = datetime.fromtimestamp(columns["last_entry_ms"] / 1000).strftime("%Y-%m-%d %H:%M:%S")
+            last_price = columns["last_price"]
 
             # get a unique list of original symbols
-            original_symbols = list({entry["original_symbol"] for entry in entries})
+            original_symbols = list(columns["original_symbols"])
 
             results.append(
                 {
@@ -404,39 +467,41 @@ class BittensorProcessor:
 
         return results
 
-    def _calculate_gradient_allocation(self, max_rank):
-        """Calculate gradient allocation weights."""
-        # Total weight is the sum of all rank values
-        total_weight = sum(max_rank + 1 - rank for rank in range(1, max_rank + 1))
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _calculate_gradient_allocation(max_rank):
+        """Calculate gradient allocation weights, indexed by rank - 1."""
+        # Total weight is the sum of all rank values, i.e. the triangular number n(n+1)/2
+        total_weight = max_rank * (max_rank + 1) // 2
         
-        # Create a dictionary with rank as key and allocation as the fractional value
-        allocations = {}
-        for rank in range(1, max_rank + 1):
-            inverted_rank = max_rank + 1 - rank
-            allocations[rank] = inverted_rank / total_weight
-        return allocations
+        # Rank 1 gets max_rank shares, the last rank gets one
+        return tuple(shares / total_weight for shares in range(max_rank, 0, -1))
 
     def _compute_net_position_and_average_price(self, orders):
         """Compute net position and average price from orders."""
+        # if any orders are flat, we will return with zero net position and zero cost basis
+        # (checked before sorting, since order doesn't matter for this)
+        if any(_order_type_tag(order["order_type"]) is _FLAT for order in orders):
+            #print("Found FLAT order. Resetting net position and cost basis.")
+            return 0.0, 0.0
+
         # Sort chronologically:
-        sorted_orders = sorted(orders, key=lambda x: x["processed_ms"])
+        sorted_orders = sorted(orders, key=_processed_ms)
+
+        # Pull (leverage, price) out of each order once so the replay is plain scalar math
+        return BittensorProcessor._replay_net_position(map(_leverage_and_price, sorted_orders))
 
+    @staticmethod
+    def _replay_net_position(legs):
+        """Replay chronological (leverage, price) legs into a net position and its average price."""
         net_position = 0.0
         cost_basis   = 0.0  # Weighted average cost of the net_position
-        
-        # if any orders are flat, we will return with zero net position and zero cost basis
-        if any(order["order_type"].upper().strip() == "FLAT" for order in sorted_orders):
-            #print("Found FLAT order. Resetting net position and cost basis.")
-            return net_position, cost_basis
 
-        for order in sorted_orders:
+        for qty, price in legs:
             # Skip zero-sized orders, but DO NOT skip FLAT orders anymore!
-            if abs(order["leverage"]) == 0:
+            if qty == 0:
                 continue
 
-            qty   = order["leverage"]
-            price = order["price"]
-
             if net_position * qty > 0:
                 # Same direction => Weighted average
                 new_position = net_position + qty
@@ -464,34 +529,50 @@ class BittensorProcessor:
         if not os.path.exists(self.ARCHIVE_DIR):
             os.makedirs(self.ARCHIVE_DIR)
             
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         
-        for filename in os.listdir(self.RAW_SIGNALS_DIR):
-            # Only process bittensor signal files
-            if not filename.startswith(f'{self.SIGNAL_FILE_PREFIX}_') or filename == 'archive' or filename.startswith('.'):
-                continue
-            
-            file_path = os.path.join(self.RAW_SIGNALS_DIR, filename)
-            if not os.path.isfile(file_path):
-                continue
-            
-            file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-            if file_time < cutoff:
+        # is_file() comes from the directory listing; a file past the name filter costs one stat() for its mtime
+        with os.scandir(self.RAW_SIGNALS_DIR) as entries:
+            for entry in entries:
+                # Only process bittensor signal files
+                filename = entry.name
+                if not filename.startswith(f'{self.SIGNAL_FILE_PREFIX}_') or filename == 'archive' or filename.startswith('.'):
+                    continue
+                
+                if not entry.is_file() or entry.stat().st_mtime >= cutoff_ts:
+                    continue
+                
                 # Create zip file name with original timestamp
                 zip_filename = f"{os.path.splitext(filename)[0]}.zip"
                 zip_path = os.path.join(self.ARCHIVE_DIR, zip_filename)
                 
-                # Create zip file and add the old file
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    zipf.write(file_path, filename)
+                # Create zip file and add the old file; zipf.write streams it in chunks
+                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                                     compresslevel=self.ARCHIVE_COMPRESS_LEVEL) as zipf:
+                    zipf.write(entry.path, filename)
                 
                 # Remove the original file
-                os.remove(file_path)
+                os.remove(entry.path)
                 print(f"Archived {filename} to {zip_filename}")
 
     def filter_positions_by_assets(self, data, asset_list):
         """Filter positions to include only those with specified assets."""
+        return self._filter_positions_with_stats(data, asset_list)[0]
+
+    def _filter_positions_with_stats(self, data, asset_list):
+        """filter_positions_by_assets plus {hotkey: BTTSN8MinerStats} for the kept miners."""
         filtered_data = {}
+        miner_stats = {}
+        asset_set = frozenset(asset_list)
+
+        # One cutoff for the whole payload instead of a clock read per miner
+        cutoff_ms = None
+        if self.MAX_TRADE_AGE_DAYS < float('inf'):
+            cutoff_ms = datetime.now().timestamp() * 1000 - self.MAX_TRADE_AGE_DAYS * 86_400_000
+
+        # Miners are independent, but the work per miner is interpreter-bound dict access and the
+        # order replay, so threads would serialize on the GIL and worker processes would spend
+        # longer pickling the payload than scoring it; this stays a single sequential pass
         for miner, details in data.items():
             if details["thirty_day_returns"] <= 0:
                 continue
@@ -499,43 +580,59 @@ class BittensorProcessor:
             if details["all_time_returns"] <= 0:
                 continue
             
-            profitable_trades = 0
-            total_trades = 0
-            asset_trades = {}
-            latest_trade = 0
-            for position in details["positions"]:
-                if position["trade_pair"][0] not in asset_list:
-                    continue
-                
-                asset_trades[position["trade_pair"][0]] = asset_trades.get(position["trade_pair"][0], 0) + 1
-                
-                if position["is_closed_position"]:
-                    return_at_close = position["return_at_close"] - 1
-                    if return_at_close > 0:
-                        profitable_trades += 1
-                    latest_trade = max(latest_trade, position["close_ms"])
-                    total_trades += 1
+            filtered_positions, returns, asset_trades, latest_trade = self._scan_miner_positions(
+                details["positions"], asset_set
+            )
             
             if self.MIN_TRADES_PER_ASSET > 0:
-                skip = False
-                for asset in asset_list:
-                    if asset_trades.get(asset, 0) < self.MIN_TRADES_PER_ASSET:
-                        skip = True
-                        break
-                if skip:
+                if not all(asset_trades.get(asset, 0) >= self.MIN_TRADES_PER_ASSET for asset in asset_list):
                     continue
             
-            if self.MAX_TRADE_AGE_DAYS < float('inf'):
-                if latest_trade < datetime.now().timestamp() * 1000 - self.MAX_TRADE_AGE_DAYS * 24 * 60 * 60 * 1000:
-                    continue
+            if cutoff_ms is not None and latest_trade < cutoff_ms:
+                continue
             
-            filtered_positions = [
-                pos for pos in details["positions"]
-                if pos["trade_pair"][0] in asset_list
-            ]
             if filtered_positions:
                 filtered_data[miner] = {**details, "positions": filtered_positions}
-        return filtered_data
+                # Scoring reuses these instead of walking the positions again
+                miner_stats[miner] = self._miner_stats(filtered_positions, returns, asset_trades, latest_trade)
+        return filtered_data, miner_stats
+
+    def _scan_miner_positions(self, positions, asset_set=None):
+        """Single pass over a miner's positions: (kept positions, returns, trades per asset, latest close_ms)."""
+        kept = []
+        returns = []
+        asset_trades = {}
+        latest_trade = 0
+        keep = kept.append
+        record_return = returns.append
+        for position in positions:
+            asset = position["trade_pair"][0]
+            if asset_set is not None and asset not in asset_set:
+                continue
+            
+            keep(position)
+            asset_trades[asset] = asset_trades.get(asset, 0) + 1
+            
+            if position["is_closed_position"]:
+                record_return(position["return_at_close"] - 1)
+                close_ms = position["close_ms"]
+                if close_ms > latest_trade:
+                    latest_trade = close_ms
+            else:
+                record_return(position["current_return"] - 1)
+        return kept, returns, asset_trades, latest_trade
+
+    def _miner_stats(self, positions, returns, asset_trades, latest_trade):
+        """Bundle a miner's scan results with the figures derived from them."""
+        position_returns = np.asarray(returns, dtype=np.float64)
+        return BTTSN8MinerStats(
+            position_returns=position_returns,
+            profitable=int(np.count_nonzero(position_returns > 0)),
+            total=len(positions),
+            latest_trade=latest_trade,
+            max_drawdown=self.calculate_max_drawdown_from_positions(positions),
+            asset_counts=asset_trades,
+        )
 
     async def get_ranked_miners(self, assets_to_trade=None):
         """Fetch and rank miners."""
@@ -560,38 +657,43 @@ class BittensorProcessor:
         
         return rankings, ranked_miners
 
-    def calculate_miner_scores(self, data):
-        """Calculate scores for each miner based on their trading performance."""
-        metrics_data = []
+    def calculate_miner_scores(self, data, miner_stats=None):
+        """Calculate scores for each miner based on their trading performance.
+
+        `miner_stats` is the {hotkey: BTTSN8MinerStats} map from the asset filter; miners missing
+        from it have their stats computed here.
+        """
+        miner_stats = miner_stats or {}
+        # Metrics of the miners that pass the filters, one column per metric
+        hotkeys = []
+        max_drawdowns = []
+        total_returns = []
+        profitable_rates = []
+        position_counts = []
+        miner_returns = []  # position returns per kept miner, for the batched Sharpe below
+        miner_positions = []  # positions per kept miner, for the batched consistency score below
         
         for hotkey, miner in data.items():
-            if not miner['positions']:
+            positions = miner['positions']
+            if not positions:
                 continue
-                
-            position_returns = []
-            profitable_trades = 0
-            total_trades = 0
             
+            # Returns, profitability and drawdown come precomputed from the asset filter when available
+            stats = miner_stats.get(hotkey)
+            if stats is None:
+                stats = self._miner_stats(positions, *self._scan_miner_positions(positions)[1:])
+                
             # Calculate max drawdown from filtered positions
-            max_drawdown = self.calculate_max_drawdown_from_positions(miner['positions'])
+            max_drawdown = stats.max_drawdown
             
             # Skip miners with extreme drawdowns
             if max_drawdown < self.MAX_DRAWDOWN_THRESHOLD:
                 continue
             
-            # Process each position for returns and profitability
-            for position in miner['positions']:
-                if position['is_closed_position']:
-                    return_at_close = position['return_at_close'] - 1
-                    position_returns.append(return_at_close)
-                    if return_at_close > 0:
-                        profitable_trades += 1
-                else:
-                    current_return = position['current_return'] - 1
-                    position_returns.append(current_return)
-                    if current_return > 0:
-                        profitable_trades += 1
-                total_trades += 1
+            # Returns and profitability: realised return if closed, else current
+            total_trades = stats.total
+            position_returns = stats.position_returns
+            profitable_trades = stats.profitable
             
             # Apply minimum trade requirement
             if total_trades < self.MIN_TRADES:
@@ -602,83 +704,96 @@ class BittensorProcessor:
                 continue
                 
             # Calculate metrics
-            sharpe_ratio = self.calculate_sharpe_ratio(position_returns)
-            consistency_score = self.get_trade_consistency_score(miner)
             position_count = total_trades
-            total_return = sum(position_returns)
+            total_return = float(position_returns.sum())
             
             # Skip if below minimum return
             if total_return <= self.MIN_TOTAL_RETURN:
                 continue
             
-            metrics_data.append({
-                'hotkey': hotkey,
-                'metrics': {
-                    'max_drawdown': max_drawdown,
-                    'sharpe_ratio': sharpe_ratio,
-                    'total_return': total_return,
-                    'percentage_profitable': percentage_profitable,
-                    'position_count': position_count,
-                    'consistency_score': consistency_score
-                }
-            })
+            hotkeys.append(hotkey)
+            max_drawdowns.append(max_drawdown)
+            total_returns.append(total_return)
+            profitable_rates.append(percentage_profitable)
+            position_counts.append(position_count)
+            miner_returns.append(position_returns)
+            miner_positions.append(positions)
         
-        if not metrics_data:
+        if not hotkeys:
             return []
         
-        # Calculate percentile ranks for metrics that should be normalized
-        all_metrics = [m['metrics'] for m in metrics_data]
-        sharpe_percentiles = self.normalize_to_percentile([m['sharpe_ratio'] for m in all_metrics])
-        position_count_percentiles = self.normalize_to_percentile([m['position_count'] for m in all_metrics])
-        consistency_percentiles = self.normalize_to_percentile([m['consistency_score'] for m in all_metrics])
+        # Calculate percentile ranks for metrics that should be normalized, all three in one sort
+        sharpe_scores, position_count_scores, consistency_scores = self.normalize_columns_to_percentile([
+            self.calculate_sharpe_ratios(miner_returns),
+            position_counts,
+            self.calculate_trade_consistency_scores(miner_positions),
+        ])
         
-        # Create normalized scores
-        normalized_metrics = []
-        for idx, miner_data in enumerate(metrics_data):
-            metrics = miner_data['metrics']
-            
-            # Convert drawdown to positive score and apply penalty
-            drawdown_score = 1.0 + metrics['max_drawdown']
-            drawdown_score = drawdown_score ** 2
-            
-            # Convert total return to absolute value
-            return_score = 1.0 + metrics['total_return']
-            
-            # Calculate position count bonus
-            position_count_bonus = np.log1p(metrics['position_count']) / self.POSITION_COUNT_DIVISOR
-            
-            normalized = {
-                'hotkey': miner_data['hotkey'],
-                'max_drawdown': float(drawdown_score),
-                'total_return': float(return_score),
-                'sharpe_ratio': float(sharpe_percentiles[idx]),
-                'percentage_profitable': float(metrics['percentage_profitable']),
-                'position_count': float(position_count_percentiles[idx]),
-                'consistency_score': float(consistency_percentiles[idx])
+        # Score every miner at once from the metric columns. Kept in float64: with float32's ~7 significant
+        # digits, total scores that close would tie and reorder, and these columns are only miners long
+        drawdown_scores = (1.0 + np.array(max_drawdowns)) ** 2  # positive score with penalty
+        return_scores = 1.0 + np.array(total_returns)
+        profitable_rates = np.array(profitable_rates)
+        position_count_bonus = np.log1p(position_counts) / self.POSITION_COUNT_DIVISOR
+
+        # Calculate total score with configured weights, accumulated into one buffer in the same term order
+        total_scores = drawdown_scores**self.DRAWDOWN_EXPONENT
+        total_scores += sharpe_scores**self.SHARPE_EXPONENT
+        total_scores += return_scores
+        total_scores += profitable_rates**self.PROFITABLE_RATE_EXPONENT
+        total_scores += position_count_scores * position_count_bonus
+        total_scores += consistency_scores
+
+        # Highest total score first; stable so ties keep input order as sorted(reverse=True) did
+        ranking = np.argsort(-total_scores, kind='stable')
+
+        # Create normalized scores in rank order
+        return [
+            {
+                'hotkey': hotkey,
+                'max_drawdown': drawdown_score,
+                'total_return': return_score,
+                'sharpe_ratio': sharpe_score,
+                'percentage_profitable': profitable_rate,
+                'position_count': position_count_score,
+                'consistency_score': consistency_score,
+                'total_score': total_score,
             }
-            
-            # Calculate total score with configured weights
-            normalized['total_score'] = float(
-                normalized['max_drawdown']**self.DRAWDOWN_EXPONENT +
-                normalized['sharpe_ratio']**self.SHARPE_EXPONENT +
-                normalized['total_return'] +
-                normalized['percentage_profitable']**self.PROFITABLE_RATE_EXPONENT +
-                normalized['position_count'] * position_count_bonus +
-                normalized['consistency_score']
+            for hotkey, drawdown_score, return_score, sharpe_score, profitable_rate,
+                position_count_score, consistency_score, total_score in zip(
+                map(hotkeys.__getitem__, ranking.tolist()),
+                drawdown_scores[ranking].tolist(),
+                return_scores[ranking].tolist(),
+                sharpe_scores[ranking].tolist(),
+                profitable_rates[ranking].tolist(),
+                position_count_scores[ranking].tolist(),
+                consistency_scores[ranking].tolist(),
+                total_scores[ranking].tolist(),
             )
-            
-            normalized_metrics.append(normalized)
-        
-        return sorted(normalized_metrics, key=lambda x: x['total_score'], reverse=True)
+        ]
 
     def rank_miners(self, positions_data, assets_to_trade=None):
         """Rank miners by their total score."""
+        # The signal loop ranks the same payload every cycle until it is refetched, so reuse the
+        # result for that payload object; the trade age cutoff is applied as of the first ranking
+        assets_key = tuple(assets_to_trade) if assets_to_trade else None
+        memo = self._ranking_memo
+        if memo is not None and memo[0] is positions_data and memo[1] == assets_key:
+            return memo[2]
+        
+        result = self._rank_miners(positions_data, assets_to_trade)
+        self._ranking_memo = (positions_data, assets_key, result)
+        return result
+
+    def _rank_miners(self, positions_data, assets_to_trade=None):
+        """Filter and score the payload; rank_miners wraps this with the per-payload memo."""
         # Filter by assets
+        miner_stats = None
         if assets_to_trade:
-            positions_data = self.filter_positions_by_assets(positions_data, assets_to_trade)
+            positions_data, miner_stats = self._filter_positions_with_stats(positions_data, assets_to_trade)
         
         # Calculate scores and sort miners
-        ranked_miners = self.calculate_miner_scores(positions_data)
+        ranked_miners = self.calculate_miner_scores(positions_data, miner_stats)
         
         # Build rankings dictionary
         rankings = {miner['hotkey']: rank + 1 for rank, miner in enumerate(ranked_miners)}
@@ -694,19 +809,57 @@ class BittensorProcessor:
 
     def calculate_sharpe_ratio(self, position_returns):
         """Calculate the Sharpe Ratio for a series of returns."""
-        if len(position_returns) < 2:
+        count = len(position_returns)
+        if count < 2:
             return 0
-        returns = np.array(position_returns)
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
+        if count >= self.SHARPE_VECTORIZE_MIN_RETURNS:
+            returns = np.asarray(position_returns)  # no copy when handed an array
+            mean_return = np.mean(returns)
+            std_return = np.std(returns)
+        else:
+            # Short series: plain floats are cheaper than NumPy's per-call overhead.
+            # Two passes like np.std; sum/sum-of-squares cancels badly when returns barely vary
+            returns = position_returns.tolist() if isinstance(position_returns, np.ndarray) else position_returns
+            mean_return = sum(returns) / count
+            std_return = sqrt(sum((r - mean_return) ** 2 for r in returns) / count)
         return mean_return / std_return if std_return != 0 else 0
 
+    def calculate_sharpe_ratios(self, returns_list):
+        """Calculate Sharpe Ratios for many return series at once, matching calculate_sharpe_ratio."""
+        lengths = np.fromiter(map(len, returns_list), dtype=np.intp, count=len(returns_list))
+        sharpe_ratios = np.zeros(lengths.size)
+        scored = np.flatnonzero(lengths >= 2)
+        if not scored.size:
+            return sharpe_ratios.tolist()
+
+        # One segmented reduction over the concatenated series instead of mean/std per miner
+        counts = lengths[scored]
+        flat = np.concatenate([np.asarray(returns_list[i], dtype=np.float64) for i in scored])
+        means, stds = self._segmented_mean_std(flat, counts)
+
+        nonzero = stds != 0
+        sharpe_ratios[scored[nonzero]] = means[nonzero] / stds[nonzero]
+        return sharpe_ratios.tolist()
+
+    @staticmethod
+    def _segmented_mean_std(values, counts):
+        """np.mean/np.std of each consecutive segment of a flat array of ragged series (counts >= 1)."""
+        starts = np.zeros(counts.size, dtype=np.intp)
+        np.cumsum(counts[:-1], out=starts[1:])
+        means = np.add.reduceat(values, starts) / counts
+        deviations = values - np.repeat(means, counts)
+        stds = np.sqrt(np.add.reduceat(deviations * deviations, starts) / counts)
+        return means, stds
+
     def calculate_max_drawdown_from_orders(self, orders):
         """Calculate max drawdown for a position considering leverage and price changes."""
+        if len(orders) >= self.DRAWDOWN_VECTORIZE_MIN_ORDERS:
+            return self._max_drawdown_from_orders_vectorized(orders)
+
+        # Scalar locals only: no temporaries or per-order method lookups in the loop
         cumulative_leverage = 0
         weighted_sum_price = 0
         max_drawdown = 0
-        current_price = None
 
         for order in orders:
             if not isinstance(order, dict):
@@ -724,31 +877,57 @@ class BittensorProcessor:
             
             weighted_sum_price += leverage * price
             average_price = weighted_sum_price / cumulative_leverage
-            current_price = price
 
-            if cumulative_leverage > 0:  # Long position
-                price_drawdown = (current_price - average_price) / average_price
-                account_drawdown = price_drawdown * abs(cumulative_leverage)
-            else:  # Short position
-                price_drawdown = (average_price - current_price) / average_price
-                account_drawdown = price_drawdown * abs(cumulative_leverage)
-
-            max_drawdown = min(max_drawdown, -abs(account_drawdown))
+            # Long and short drawdowns only differ in sign, which the abs() drops
+            account_drawdown = -abs((price - average_price) / average_price * cumulative_leverage)
+            if account_drawdown < max_drawdown:
+                max_drawdown = account_drawdown
 
         return max_drawdown
 
+    def _max_drawdown_from_orders_vectorized(self, orders):
+        """NumPy version of calculate_max_drawdown_from_orders for long order histories."""
+        if not all(isinstance(order, dict) for order in orders):
+            raise ValueError("Each order must be a dictionary")
+
+        prices = np.fromiter((order.get("price", 0) for order in orders), dtype=np.float64, count=len(orders))
+        leverages = np.fromiter((order.get("leverage", 0) for order in orders), dtype=np.float64, count=len(orders))
+
+        # Orders without size or price don't move the position
+        traded = (leverages != 0) & (prices != 0)
+        prices, leverages = prices[traded], leverages[traded]
+
+        # Legs that bring the net back to zero don't contribute to the average price
+        cumulative_leverage = np.cumsum(leverages)
+        open_legs = cumulative_leverage != 0
+        if not open_legs.any():
+            return 0
+        weighted_sum_price = np.cumsum(np.where(open_legs, leverages * prices, 0.0))
+
+        cumulative_leverage = cumulative_leverage[open_legs]
+        average_price = weighted_sum_price[open_legs]
+        average_price /= cumulative_leverage
+        account_drawdown = prices[open_legs]
+
+        # Long and short drawdowns only differ in sign, which the abs() drops.
+        # Worked in place on the masked copies so no further temporaries are allocated.
+        account_drawdown -= average_price
+        account_drawdown /= average_price
+        np.abs(account_drawdown, out=account_drawdown)
+        account_drawdown *= np.abs(cumulative_leverage, out=cumulative_leverage)
+        return min(0, -float(account_drawdown.max()))
+
     def calculate_max_drawdown_from_positions(self, positions):
         """Calculate the largest max drawdown from all positions."""
-        max_drawdown = 0
-        for position in positions:
-            orders = position.get("orders", [])
-            drawdown = self.calculate_max_drawdown_from_orders(orders)
-            max_drawdown = min(max_drawdown, drawdown)
-        return max_drawdown
+        drawdown_of = self.calculate_max_drawdown_from_orders
+        return min(0, min((drawdown_of(position.get("orders", [])) for position in positions), default=0))
 
     def get_trade_consistency_score(self, miner):
         """Calculate consistency based on the standard deviation of trade intervals."""
-        positions = sorted(miner['positions'], key=lambda pos: pos['open_ms'])
+        if len(miner['positions']) >= self.CONSISTENCY_VECTORIZE_MIN_POSITIONS:
+            return self._trade_consistency_score_vectorized(miner['positions'])
+
+        positions = sorted(miner['positions'], key=_open_ms)
         if len(positions) < 2:
             return 0
 
@@ -762,23 +941,95 @@ class BittensorProcessor:
         
         return 1 - (std_interval / mean_interval if mean_interval != 0 else 0)
 
+    def _trade_consistency_score_vectorized(self, positions):
+        """NumPy version of get_trade_consistency_score for miners with many positions."""
+        count = len(positions)
+        open_ms = np.fromiter((pos['open_ms'] for pos in positions), dtype=np.float64, count=count)
+        close_ms = np.fromiter((pos['close_ms'] for pos in positions), dtype=np.float64, count=count)
+
+        # Stable, so positions opened in the same millisecond keep their order as with sorted();
+        # skipped when they already arrive in open order
+        if not np.all(open_ms[1:] >= open_ms[:-1]):
+            chronological = np.argsort(open_ms, kind='stable')
+            open_ms = open_ms[chronological]
+            close_ms = close_ms[chronological]
+        intervals = open_ms[1:] - close_ms[:-1]
+
+        mean_interval = intervals.mean()
+        std_interval = intervals.std()
+
+        return 1 - (std_interval / mean_interval if mean_interval != 0 else 0)
+
+    def calculate_trade_consistency_scores(self, position_lists):
+        """Calculate consistency scores for many miners at once, matching get_trade_consistency_score."""
+        counts = np.fromiter(map(len, position_lists), dtype=np.intp, count=len(position_lists))
+        scores = np.zeros(counts.size)
+        scored = np.flatnonzero(counts >= 2)
+        if not scored.size:
+            return scores.tolist()
+
+        # Flatten the kept miners' positions into columns tagged with their miner. Two plain float64
+        # columns fill faster than one structured (open_ms, close_ms) array, which needs a tuple per row
+        counts = counts[scored]
+        total = int(counts.sum())
+        flat_positions = list(itertools.chain.from_iterable(map(position_lists.__getitem__, scored.tolist())))
+        open_ms = np.fromiter(map(_open_ms, flat_positions), dtype=np.float64, count=total)
+        close_ms = np.fromiter(map(_close_ms, flat_positions), dtype=np.float64, count=total)
+        miner_ids = np.repeat(np.arange(counts.size), counts)
+
+        # Sort by open time within each miner (lexsort is stable, like sorted()), unless the
+        # positions already arrive in that order, which is the usual case
+        same_miner = miner_ids[1:] == miner_ids[:-1]
+        if not np.all((open_ms[1:] >= open_ms[:-1]) | ~same_miner):
+            chronological = np.lexsort((open_ms, miner_ids))
+            open_ms = open_ms[chronological]
+            close_ms = close_ms[chronological]
+
+        # Drop the interval that would span two miners; each miner keeps count - 1 intervals
+        intervals = (open_ms[1:] - close_ms[:-1])[same_miner]
+        means, stds = self._segmented_mean_std(intervals, counts - 1)
+
+        nonzero = means != 0
+        ratios = np.zeros(counts.size)
+        ratios[nonzero] = stds[nonzero] / means[nonzero]
+        scores[scored] = 1 - ratios
+        return scores.tolist()
+
     def get_position_count_score(self, n_positions, max_positions):
         """Calculate position count score using logarithmic scaling."""
-        return np.log1p(n_positions) / np.log1p(max_positions)
+        # math.log1p on plain scalars skips NumPy's ufunc dispatch
+        return log1p(n_positions) / log1p(max_positions)
 
     def normalize_to_percentile(self, values, reverse=False):
         """Normalize values to percentile ranks (0-1)."""
         if not values:
             return []
         
-        sorted_with_idx = sorted(enumerate(values), key=lambda x: x[1], reverse=not reverse)
-        n = len(sorted_with_idx)
+        arr = np.asarray(values, dtype=np.float64)
+        n = arr.size
+        if n == 1:
+            return [1.0]
+
+        # Highest value first unless reversed; stable so ties keep input order as sorted() did
+        order = np.argsort(arr if reverse else -arr, kind='stable')
+        ranks = np.empty(n, dtype=np.intp)
+        ranks[order] = np.arange(n)
         
-        ranks = [0] * n
-        for rank, (idx, _) in enumerate(sorted_with_idx):
-            ranks[idx] = 1.0 - (rank / (n - 1) if n > 1 else 0)
-        
-        return ranks
+        return (1.0 - ranks / (n - 1)).tolist()
+
+    def normalize_columns_to_percentile(self, columns):
+        """Normalize each of several equal-length columns to percentile ranks (0-1), as normalize_to_percentile."""
+        arr = np.asarray(columns, dtype=np.float64)
+        n = arr.shape[1]
+        if n == 1:
+            return np.ones_like(arr)
+
+        # Highest value first; stable so ties keep input order, row by row in one call
+        order = np.argsort(-arr, axis=1, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(n), axis=1)
+
+        return 1.0 - ranks / (n - 1)
 
     def calculate_asset_metrics(self, positions, asset):
         """Calculate metrics for a specific asset from positions."""
@@ -819,9 +1070,14 @@ class BittensorProcessor:
                 'consistency_score': miner['consistency_score']
             }
             
+            # Group the miner's positions by asset once instead of rescanning them for every asset
+            positions_by_asset = {}
+            for p in positions_data[hotkey]['positions']:
+                positions_by_asset.setdefault(p["trade_pair"][0], []).append(p)
+            
             asset_metrics = {}
             for asset in assets_to_trade:
-                positions = [p for p in positions_data[hotkey]['positions'] if p["trade_pair"][0] == asset]
+                positions = positions_by_asset.get(asset, [])
                 metrics = self.calculate_asset_metrics(positions, asset)
                 if metrics:
                     # Calculate per-asset profitable trade percentage
@@ -31,13 +31,10 @@ class TradingViewProcessor:
 
     def _get_recent_files(self, directory, days=70):
         """Retrieve files modified within the last `days`."""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_files = []
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
-            if os.path.isfile(file_path) and datetime.fromtimestamp(os.path.getmtime(file_path)) > cutoff:
-                recent_files.append(file_path)
-        return recent_files
+        # One clock read, compared against raw mtimes rather than a datetime per file
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.is_file() and entry.stat().st_mtime > cutoff_ts]
 
     def _normalize_symbol(self, symbol):
         """Normalize the symbol based on the core asset mapping."""
@@ -136,29 +133,29 @@ class TradingViewProcessor:
         if not os.path.exists(self.ARCHIVE_DIR):
             os.makedirs(self.ARCHIVE_DIR)
             
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         
-        for filename in os.listdir(self.RAW_SIGNALS_DIR):
-            # Only process trade request files
-            if not filename.startswith(f'{self.SIGNAL_FILE_PREFIX}_') or filename == 'archive' or filename.startswith('.'):
-                continue
+        # One stat() per file for its mtime, with no separate isfile()/getmtime() calls
+        with os.scandir(self.RAW_SIGNALS_DIR) as entries:
+            for entry in entries:
+                # Only process trade request files
+                filename = entry.name
+                if not filename.startswith(f'{self.SIGNAL_FILE_PREFIX}_') or filename == 'archive' or filename.startswith('.'):
+                    continue
                 
-            file_path = os.path.join(self.RAW_SIGNALS_DIR, filename)
-            if not os.path.isfile(file_path):
-                continue
+                if not entry.is_file() or entry.stat().st_mtime >= cutoff_ts:
+                    continue
                 
-            file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-            if file_time < cutoff:
                 # Create zip file name with original timestamp
                 zip_filename = f"{os.path.splitext(filename)[0]}.zip"
                 zip_path = os.path.join(self.ARCHIVE_DIR, zip_filename)
                 
                 # Create zip file and add the old file
                 with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    zipf.write(file_path, filename)
+                    zipf.write(entry.path, filename)
                 
                 # Remove the original file
-                os.remove(file_path)
+                os.remove(entry.path)
                 print(f"Archived {filename} to {zip_filename}")
 
 # Test Function
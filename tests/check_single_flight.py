@@ -0,0 +1,61 @@
+import asyncio
+
+from core.utils.single_flight import single_flight, _inflight
+
+CALLERS = 10
+
+
+async def check_one_call():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    results = await asyncio.gather(*(single_flight(("test", "ok"), fetch) for _ in range(CALLERS)))
+    assert calls == 1, f"expected 1 call, got {calls}"
+    assert results == ["ok"] * CALLERS, results
+    print(f"{CALLERS} concurrent callers -> {calls} call")
+
+
+async def check_error_reaches_every_waiter():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(single_flight(("test", "error"), fetch) for _ in range(CALLERS)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results), results
+    print(f"error reached all {CALLERS} waiters")
+
+
+async def check_cancelled_leader():
+    async def fetch():
+        await asyncio.sleep(0.1)
+        return "ok"
+
+    leader = asyncio.create_task(single_flight(("test", "cancel"), fetch))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(single_flight(("test", "cancel"), fetch)) for _ in range(CALLERS - 1)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    results = await asyncio.gather(*waiters)
+    assert leader.cancelled()
+    assert results == ["ok"] * (CALLERS - 1), results
+    print(f"cancelled first caller; {len(results)} waiters still got the result")
+
+
+async def main():
+    await check_one_call()
+    await check_error_reaches_every_waiter()
+    await check_cancelled_leader()
+    assert not _inflight, _inflight
+    print("single_flight checks passed")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+import asyncio
+
+from core.utils.symbol_batcher import SymbolBatcher
+
+SYMBOLS = ["BTC", "ETH", "SOL"]
+CALLERS = 10
+
+
+async def check_one_call():
+    calls = 0
+
+    async def fetch_all():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"symbol": s} for s in SYMBOLS]
+
+    batcher = SymbolBatcher(fetch_all, key=lambda row: row["symbol"])
+    requested = [SYMBOLS[i % len(SYMBOLS)] for i in range(CALLERS)] + ["XRP"]
+    results = await asyncio.gather(*(batcher.fetch(s) for s in requested))
+    assert calls == 1, f"expected 1 call, got {calls}"
+    assert all(rows == [{"symbol": s}] for s, rows in zip(requested[:-1], results)), results
+    assert results[-1] == [], results[-1]
+    print(f"{len(requested)} concurrent lookups -> {calls} bulk call")
+
+
+async def check_error_reaches_every_waiter():
+    async def fetch_all():
+        raise RuntimeError("boom")
+
+    batcher = SymbolBatcher(fetch_all, key=lambda row: row["symbol"])
+    results = await asyncio.gather(*(batcher.fetch(SYMBOLS[i % len(SYMBOLS)]) for i in range(CALLERS)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results), results
+    print(f"error reached all {CALLERS} waiters")
+
+
+async def check_cancelled_flush():
+    async def fetch_all():
+        await asyncio.sleep(10)
+        return []
+
+    batcher = SymbolBatcher(fetch_all, key=lambda row: row["symbol"])
+    waiters = [asyncio.create_task(batcher.fetch(SYMBOLS[i % len(SYMBOLS)])) for i in range(CALLERS)]
+    await asyncio.sleep(0)
+    flush = batcher._task
+    await asyncio.sleep(0.05)  # past the batching window, now inside fetch_all
+    flush.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+    assert all(isinstance(r, asyncio.CancelledError) for r in results), results
+    print(f"cancelled flush; all {CALLERS} waiters were released")
+
+
+async def check_cancelled_window():
+    async def fetch_all():
+        return [{"symbol": s} for s in SYMBOLS]
+
+    batcher = SymbolBatcher(fetch_all, key=lambda row: row["symbol"])
+    waiters = [asyncio.create_task(batcher.fetch(SYMBOLS[i % len(SYMBOLS)])) for i in range(CALLERS)]
+    await asyncio.sleep(0)
+    batcher._task.cancel()  # still collecting symbols
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+    assert all(isinstance(r, asyncio.CancelledError) for r in results), results
+    assert await batcher.fetch("BTC") == [{"symbol": "BTC"}]
+    print(f"cancelled window; all {CALLERS} waiters were released and the next lookup still works")
+
+
+async def main():
+    await check_one_call()
+    await check_error_reaches_every_waiter()
+    await check_cancelled_flush()
+    await check_cancelled_window()
+    print("SymbolBatcher checks passed")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())